@@ -0,0 +1,1694 @@
+"""
+Data Export Loading Utilities
+
+This module provides loaders for the CSV exports that accompany each test in
+data/test-data (Waveform and Phasor DataExport files, loadbank logs). Parsed exports are cached
+in a typed binary format next to the CSV so that re-running an analysis does not
+re-parse hundreds of megabytes of text.
+
+USAGE EXAMPLES:
+    # Load a waveform export (parsed once, then served from the binary cache)
+    df = load_waveform_data('data/test-data/data_test_9b/DataExport_Waveform_FDR08_20260214,062236 0800.CSV')
+    
+    # Load a phasor (PMU) export the same way
+    df = load_pmu_data('data/test-data/data_test_9b/DataExport_Phasor_FDR08_20260214,062236 0800.CSV')
+    
+    # Raw typed columns without building a DataFrame
+    columns = load_export_columns(path)
+    columns['timestamp_ns']      # int64 UTC epoch nanoseconds
+    columns['channels']          # {column name: float32 array}
+    
+    # Parse only a time window: the byte range is found by bisecting line timestamps
+    df = load_waveform_data(path, window=(RUN_START, RUN_END))
+    
+    # Parse a large export on every core (first load; later loads hit the cache)
+    df = load_waveform_data(path, workers=os.cpu_count())
+    
+    # Any export family: sniff the format, parse only the wanted columns with fixed dtypes
+    sniff_export_format(path)    # e.g. 'cleangen'
+    df = load_typed_export(path, usecols=['resistive_kw (kW)'])
+    
+    # Event log: date format detected once per file, sorted index for range lookups
+    events = EventIndex.from_file('data/test-data/data_test_9b/event_log_test_9b.csv')
+    events.between(RUN_START, RUN_END)
+    
+    # All loadbank logs of a test merged into one step function of R/L/C setpoints
+    timeline = LoadbankTimeline.from_folder('data/test-data/data_test_9b')
+    setpoints = timeline.setpoint_at(window_times_ns)    # (n, 3) float32, one row per time
+    
+    # Stream selected channels of a time window straight out of an .evzip archive
+    df = load_evzip_data(path_to_evzip, channels=['V1', 'I1'], start=RUN_START, end=RUN_END)
+
+EXPORT FORMAT:
+    DataExport CSVs have one header row, a timestamp in the first column and one
+    numeric column per channel. Timestamps are in UTC unless source_tz says
+    otherwise; loaders return a DataFrame indexed by 'timestamp' converted to
+    San Diego time (America/Los_Angeles).
+
+EXPORT FAMILIES:
+    EXPORT_FORMATS registers every file family found in data/test-data
+    (Waveform/Phasor/Averaged DataExport CSVs, CleanGen unit logs, 'DATA FOR
+    BESS 600kWh' sheets, per-battery '4A_1_Batt1.csv' files, loadbank logs and
+    event logs) with its file name pattern, header keywords, source time zone
+    and column dtype. sniff_export_format identifies a file from its name, or
+    from its header when the name is not recognized; load_typed_export then
+    reads only the requested columns with fixed numpy dtypes instead of
+    parsing every column as object.
+
+EVENT LOGS:
+    Event logs are written by hand and use different date formats from test
+    to test ('2.13.2026', '2026.2.13' or '31-Oct' with no year), and may mix
+    formats within a file ('9:05' next to '10:15:30'). parse_event_values
+    tries EVENT_DATE_FORMATS / EVENT_TIME_FORMATS in order, one vectorized
+    call per format on the rows still unparsed; blank date cells carry the
+    previous row's date. EventIndex keeps the events of one or many logs sorted by
+    int64 UTC time so "events between t0 and t1" is a binary search.
+
+LOADBANK TIMELINES:
+    A test folder can hold several loadbank logs (e.g. first and second run).
+    LoadbankTimeline merges them into one int64-time-sorted array of R/L/C
+    setpoints, drops rows repeated across overlapping logs, and answers
+    setpoint_at(times) for any number of times with one searchsorted call.
+
+CACHE FORMAT:
+    '<file>.cache/' holds meta.json plus one .npy file per column (int64 epoch
+    nanoseconds for the timestamps, float32 for every channel). The cache is
+    keyed by file size, mtime, a hash of the header line and the source time
+    zone; the .npy files are opened memory-mapped, so loading is near-instant.
+
+TIMESTAMPS:
+    Every source is parsed into int64 UTC epoch nanoseconds. The timestamp
+    format of a file is detected once from its first data lines
+    (detect_file_timestamp_format, candidates in TIMESTAMP_FORMATS) and shared
+    by the full, windowed and parallel parsers; the whole column is then
+    converted with one vectorized pd.to_datetime(format=...) call. Samples
+    that no single strict format fits (e.g. a whole-second row without a
+    fraction followed by '.000500' rows) fall back to 'ISO8601'. Mana Power exports are written in UTC; loadbank and event logs are in
+    local San Diego time (source_tz). All slicing and cross-source joins
+    (slice_columns, asof_indices) work on the int64 values; conversion to San
+    Diego time happens once, when a DataFrame is built for display
+    (epoch_ns_to_index).
+
+TIME WINDOWS:
+    window=(start, end) restricts a loader to rows with start <= t <= end
+    (naive bounds are San Diego time). Exports are time-sorted, so without a
+    valid cache the loader bisects byte offsets on line timestamps, seeks to
+    the window and parses only its rows; with a valid cache the window is a
+    binary search on the cached timestamp column.
+
+PARALLEL PARSING:
+    parse_export_csv_parallel splits the data lines into newline-aligned byte
+    ranges, parses them in a process pool with fixed dtypes and writes each
+    range's rows straight into shared-memory columns at its row offset. Worker
+    processes are started with 'fork'; where fork is unavailable (Windows) the
+    file is parsed in a single process instead. The workers look up their task
+    functions by module name, so a module loaded by path must be registered in
+    sys.modules before exec_module:
+        spec = importlib.util.spec_from_file_location('utils_exports', path)
+        exports = importlib.util.module_from_spec(spec)
+        sys.modules['utils_exports'] = exports
+        spec.loader.exec_module(exports)
+    Otherwise the parse also falls back to a single process (with a warning).
+
+EVZIP ARCHIVES:
+    Each export also ships as a '.evzip' zip container holding the same CSV
+    data. read_evzip_export streams the CSV entries out of the archive in row
+    chunks, keeping only the requested channels and time window, so the large
+    extracted CSVs are not needed on disk.
+
+ERROR HANDLING:
+    - ExportDataError: Custom exception for export loading errors
+
+Author: Generated for Green Construction Task 5
+Date: February 2026
+"""
+
+import os
+import re
+import sys
+import json
+import io
+import hashlib
+import zipfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from typing import Optional, Sequence, Tuple, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Analysis time zone for all test data
+TIMEZONE_SD = 'America/Los_Angeles'
+
+# Window bounds accepted by the loaders: (start, end), either may be None
+TimeWindow = Tuple[Optional[Union[datetime, pd.Timestamp, str]], Optional[Union[datetime, pd.Timestamp, str]]]
+
+# Rows per chunk when streaming CSV data out of .evzip archives
+EVZIP_CHUNK_ROWS = 500_000
+
+# Timestamp formats tried (in order) when detecting a file's format;
+# month-first is preferred over day-first for ambiguous dates
+TIMESTAMP_FORMATS = (
+    '%Y-%m-%d %H:%M:%S.%f',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S.%f',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S.%f%z',
+    '%Y-%m-%dT%H:%M:%S%z',
+    '%Y-%m-%d %H:%M:%S.%f%z',
+    '%Y-%m-%d %H:%M:%S%z',
+    '%m/%d/%Y %H:%M:%S.%f',
+    '%m/%d/%Y %H:%M:%S',
+    '%m/%d/%Y %H:%M',
+    '%m/%d/%Y %I:%M:%S %p',
+    '%Y/%m/%d %H:%M:%S.%f',
+    '%Y/%m/%d %H:%M:%S',
+    '%d/%m/%Y %H:%M:%S',
+    'ISO8601',
+)
+TIMESTAMP_SAMPLE_SIZE = 20
+
+# Loadbank setpoint columns (resistive, inductive, capacitive) and log file pattern
+LOADBANK_SETPOINT_COLUMNS = ('resistive_kw (kW)', 'inductive_kvar (kVAR)', 'capacitive_kvar (kVAR)')
+LOADBANK_LOG_PATTERN = r'^loadbank_log.*\.csv$'
+
+# Placeholder cells some logs write for missing readings, parsed as NaN
+EXPORT_NA_VALUES = ('--',)
+
+# Registered export families. 'pattern' matches the file name, 'header' holds
+# header keywords used when the name is not recognized, 'time_column' is None
+# when the first time/date-like column is used, 'dtype' is the type of every
+# other column (str columns are kept as text) and 'na_values' lists extra
+# cell values read as missing, so placeholders still parse straight to dtype.
+EXPORT_FORMATS = {
+    'waveform': {
+        'pattern': r'^DataExport_.*Waveform.*\.csv$',
+        'header': (),
+        'source_tz': 'UTC',
+        'time_column': None,
+        'dtype': np.float32,
+        'na_values': EXPORT_NA_VALUES,
+        'description': 'Mana Power waveform DataExport',
+    },
+    'phasor': {
+        'pattern': r'^DataExport_.*Phasor.*\.csv$',
+        'header': (),
+        'source_tz': 'UTC',
+        'time_column': None,
+        'dtype': np.float32,
+        'na_values': EXPORT_NA_VALUES,
+        'description': 'Mana Power phasor (PMU) DataExport',
+    },
+    'averaged': {
+        'pattern': r'^DataExport_.*Averaged.*\.csv$',
+        'header': (),
+        'source_tz': 'UTC',
+        'time_column': None,
+        'dtype': np.float32,
+        'na_values': EXPORT_NA_VALUES,
+        'description': 'Mana Power averaged DataExport',
+    },
+    'cleangen': {
+        'pattern': r'^CleanGen_.*\.csv$',
+        'header': (),
+        'source_tz': TIMEZONE_SD,
+        'time_column': None,
+        'dtype': np.float32,
+        'na_values': EXPORT_NA_VALUES,
+        'description': 'CleanGen unit log (unit12/unit15)',
+    },
+    'bess': {
+        'pattern': r'^DATA FOR BESS 600kWh.*\.csv$',
+        'header': (),
+        'source_tz': TIMEZONE_SD,
+        'time_column': None,
+        'dtype': np.float32,
+        'na_values': EXPORT_NA_VALUES,
+        'description': 'DATA FOR BESS 600kWh sheet',
+    },
+    'battery': {
+        'pattern': r'^\d+[A-Z]_\d+_Batt\d+\.csv$',
+        'header': (),
+        'source_tz': TIMEZONE_SD,
+        'time_column': None,
+        'dtype': np.float32,
+        'na_values': EXPORT_NA_VALUES,
+        'description': 'Per-battery log (e.g. 4A_1_Batt1.csv)',
+    },
+    'loadbank': {
+        'pattern': LOADBANK_LOG_PATTERN,
+        'header': ('resistive_kw', 'inductive_kvar', 'capacitive_kvar'),
+        'source_tz': TIMEZONE_SD,
+        'time_column': None,
+        'dtype': np.float32,
+        'na_values': EXPORT_NA_VALUES,
+        'description': 'Loadbank R/L/C setpoint log',
+    },
+    'event_log': {
+        'pattern': r'^event_log.*\.csv$',
+        'header': ('event',),
+        'source_tz': TIMEZONE_SD,
+        'time_column': None,
+        'dtype': str,
+        'na_values': (),
+        'description': 'Test event log (dates parsed by load_event_log)',
+    },
+}
+
+# Event log date formats, tried in order; '%d-%b' dates carry no year
+EVENT_DATE_FORMATS = ('%m.%d.%Y', '%Y.%m.%d', '%d-%b')
+EVENT_DEFAULT_YEAR = 2025
+EVENT_TIME_FORMATS = ('%H:%M:%S', '%H:%M', '%H:%M:%S.%f', '%I:%M:%S %p', '%I:%M %p')
+
+# Lines scanned for the header row (some logs have a preamble above it)
+HEADER_SCAN_LINES = 20
+
+# Binary cache written next to each export
+EXPORT_CACHE_SUFFIX = '.cache'
+EXPORT_CACHE_VERSION = 1
+
+
+class ExportDataError(Exception):
+    """Custom exception for data export loading errors"""
+    pass
+
+
+def read_header_line(file_path: str) -> str:
+    """
+    Read the header line of a CSV export.
+    
+    Args:
+        file_path (str): Path to the CSV file
+    
+    Returns:
+        str: Header line without the trailing newline (BOM removed)
+    
+    Raises:
+        ExportDataError: If the file is missing or empty
+    """
+    if not os.path.exists(file_path):
+        raise ExportDataError(f"Export file not found: {file_path}")
+    with open(file_path, 'r', encoding='utf-8-sig', errors='replace') as f:
+        header = f.readline().rstrip('\r\n')
+    if not header:
+        raise ExportDataError(f"Export file is empty: {file_path}")
+    return header
+
+
+def to_epoch_ns(t: Union[datetime, pd.Timestamp, str], tz: str = TIMEZONE_SD) -> int:
+    """
+    Convert a time to int64 UTC epoch nanoseconds.
+    
+    Args:
+        t (datetime, pd.Timestamp or str): Time to convert
+        tz (str): Time zone assumed for naive times (default: America/Los_Angeles)
+    
+    Returns:
+        int: UTC epoch nanoseconds
+    """
+    t = pd.Timestamp(t)
+    if t.tzinfo is None:
+        t = t.tz_localize(tz)
+    return int(t.tz_convert('UTC').value)
+
+
+def export_cache_key(file_path: str, source_tz: str) -> dict:
+    """
+    Cache key for an export: file size, mtime, header hash and source time zone.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        source_tz (str): Time zone the export's timestamps are written in
+    
+    Returns:
+        dict: The cache key
+    """
+    file_stat = os.stat(file_path)
+    return {
+        'version': EXPORT_CACHE_VERSION,
+        'file_size_bytes': file_stat.st_size,
+        'mtime_ns': file_stat.st_mtime_ns,
+        'header_sha1': hashlib.sha1(read_header_line(file_path).encode('utf-8')).hexdigest(),
+        'source_tz': source_tz,
+    }
+
+
+def detect_timestamp_format(values: Sequence[str]) -> str:
+    """
+    Detect the strftime format of a file's timestamps from sample values.
+    
+    Args:
+        values (Sequence[str]): Sample timestamp strings (blank values are ignored)
+    
+    Returns:
+        str: The first format in TIMESTAMP_FORMATS that parses every sample
+    
+    Raises:
+        ExportDataError: If no candidate format matches
+    """
+    sample = [str(v).strip() for v in values if isinstance(v, str) and v.strip()][:TIMESTAMP_SAMPLE_SIZE]
+    if not sample:
+        raise ExportDataError("No timestamp values to detect a format from")
+    for fmt in TIMESTAMP_FORMATS:
+        try:
+            pd.to_datetime(sample, format=fmt)
+            return fmt
+        except (ValueError, TypeError):
+            continue
+    raise ExportDataError(f"Unrecognized timestamp format, e.g. '{sample[0]}'")
+
+
+def detect_file_timestamp_format(file_path: str) -> str:
+    """
+    Detect the timestamp format of a CSV from its first data lines.
+    
+    Up to TIMESTAMP_SAMPLE_SIZE non-blank lines after the header are sampled,
+    so a single row printed differently (e.g. a whole second without the
+    fractional part) does not pin a strict format the rest of the file breaks.
+    
+    Args:
+        file_path (str): Path to the CSV file (timestamp in the first column)
+    
+    Returns:
+        str: The detected format (see detect_timestamp_format)
+    
+    Raises:
+        ExportDataError: If the file has no data lines or no candidate format matches
+    """
+    values = []
+    with open(file_path, 'rb') as f:
+        f.readline()
+        for line in f:
+            if line.strip():
+                values.append(line.split(b',', 1)[0].decode('utf-8', errors='replace'))
+                if len(values) >= TIMESTAMP_SAMPLE_SIZE:
+                    break
+    return detect_timestamp_format(values)
+
+
+def timestamps_to_epoch_ns(timestamps: Union[pd.Series, Sequence[str]], source_tz: str,
+                           fmt: Optional[str] = None) -> np.ndarray:
+    """
+    Parse timestamp strings into int64 UTC epoch nanoseconds in one vectorized call.
+    
+    Args:
+        timestamps (pd.Series or Sequence[str]): Timestamp strings from one source
+        source_tz (str): Time zone of naive timestamps (ignored if the format has an offset)
+        fmt (str, optional): strftime format; detected from the first values if None
+    
+    Returns:
+        np.ndarray: int64 UTC epoch nanoseconds
+    
+    Raises:
+        ExportDataError: If the timestamps do not match the format
+    """
+    values = pd.Series(timestamps, dtype=object).str.strip()
+    if len(values) == 0:
+        return np.empty(0, dtype=np.int64)
+    fmt = fmt or detect_timestamp_format(values.iloc[:TIMESTAMP_SAMPLE_SIZE * 5].tolist())
+    try:
+        try:
+            parsed = pd.DatetimeIndex(pd.to_datetime(values, format=fmt))
+        except ValueError:
+            if fmt == 'ISO8601':
+                raise
+            # A row outside the sample may still be written differently (e.g. no fraction)
+            parsed = pd.DatetimeIndex(pd.to_datetime(values, format='ISO8601'))
+        if parsed.tz is not None:
+            parsed = parsed.tz_convert('UTC').tz_localize(None)
+        elif source_tz != 'UTC':
+            parsed = parsed.tz_localize(source_tz).tz_convert('UTC').tz_localize(None)
+    except (ValueError, TypeError) as e:
+        raise ExportDataError(f"Could not parse timestamps with format '{fmt}': {e}")
+    return parsed.as_unit('ns').asi8
+
+
+def epoch_ns_to_index(timestamp_ns: np.ndarray, tz: str = TIMEZONE_SD, name: str = 'timestamp') -> pd.DatetimeIndex:
+    """
+    Convert int64 UTC epoch nanoseconds to a DatetimeIndex in tz, for display.
+    
+    Args:
+        timestamp_ns (np.ndarray): int64 UTC epoch nanoseconds
+        tz (str): Display time zone (default: America/Los_Angeles)
+        name (str): Index name (default: 'timestamp')
+    
+    Returns:
+        pd.DatetimeIndex: Timezone-aware index
+    """
+    index = pd.DatetimeIndex(np.asarray(timestamp_ns, dtype=np.int64).view('datetime64[ns]'), name=name)
+    return index.tz_localize('UTC').tz_convert(tz)
+
+
+def asof_indices(target_ns: np.ndarray, source_ns: np.ndarray) -> np.ndarray:
+    """
+    For each target time, the index of the last source row at or before it.
+    
+    A pure integer join between two time-sorted sources (e.g. labeling
+    waveform windows with the loadbank row in effect).
+    
+    Args:
+        target_ns (np.ndarray): int64 UTC epoch ns to look up
+        source_ns (np.ndarray): Sorted int64 UTC epoch ns of the source rows
+    
+    Returns:
+        np.ndarray: Source row indices, -1 where a target precedes every source row
+    """
+    return np.searchsorted(np.asarray(source_ns), np.asarray(target_ns), side='right') - 1
+
+
+def line_timestamp_ns(line: bytes, source_tz: str, fmt: Optional[str] = None) -> int:
+    """
+    UTC epoch nanoseconds of the timestamp in the first field of a CSV line.
+    
+    Args:
+        line (bytes): One CSV data line
+        source_tz (str): Time zone of naive timestamps
+        fmt (str, optional): strftime format of the timestamp (detected if None)
+    
+    Returns:
+        int: UTC epoch nanoseconds
+    """
+    value = line.split(b',', 1)[0].decode('utf-8', errors='replace')
+    return int(timestamps_to_epoch_ns([value], source_tz, fmt)[0])
+
+
+def find_window_byte_range(file_path: str, start_ns: Optional[int], end_ns: Optional[int],
+                           source_tz: str, fmt: Optional[str] = None) -> Tuple[int, int]:
+    """
+    Byte range [first, stop) of the data lines with start_ns <= t <= end_ns.
+    
+    The file must be sorted by time. Each bound is found by bisecting byte
+    offsets: seek to the middle, skip to the next line start and parse only that
+    line's timestamp, so a bound costs about log2(file size) single-line parses.
+    
+    Args:
+        file_path (str): Path to the time-sorted CSV file
+        start_ns (int, optional): Window start in UTC epoch ns (default: first line)
+        end_ns (int, optional): Window end in UTC epoch ns, inclusive (default: last line)
+        source_tz (str): Time zone of naive timestamps in the file
+        fmt (str, optional): Timestamp format (default: detect_file_timestamp_format)
+    
+    Returns:
+        Tuple[int, int]: Byte offsets of the first line in the window and of the
+        first line after it
+    """
+    size = os.path.getsize(file_path)
+    with open(file_path, 'rb') as f:
+        f.readline()
+        data_start = f.tell()
+        first_line = f.readline()
+        if not first_line.strip():
+            return data_start, data_start
+        fmt = fmt or detect_file_timestamp_format(file_path)
+        
+        def line_start_at_or_after(offset: int) -> int:
+            if offset <= data_start:
+                return data_start
+            f.seek(offset - 1)
+            f.readline()
+            return f.tell()
+        
+        def first_line_where(predicate) -> int:
+            lo, hi = data_start, size
+            while lo < hi:
+                mid = (lo + hi) // 2
+                pos = line_start_at_or_after(mid)
+                if pos >= size:
+                    hi = mid
+                    continue
+                f.seek(pos)
+                line = f.readline()
+                if not line.strip() or predicate(line_timestamp_ns(line, source_tz, fmt)):
+                    hi = mid
+                else:
+                    lo = mid + 1
+            return line_start_at_or_after(lo)
+        
+        first = data_start if start_ns is None else first_line_where(lambda t: t >= start_ns)
+        stop = size if end_ns is None else first_line_where(lambda t: t > end_ns)
+    return first, max(first, stop)
+
+
+def window_to_epoch_ns(window: Optional[TimeWindow], tz: str = TIMEZONE_SD) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Convert a (start, end) window to UTC epoch nanoseconds.
+    
+    Args:
+        window (tuple, optional): (start, end); None or a None bound means unbounded
+        tz (str): Time zone assumed for naive bounds (default: America/Los_Angeles)
+    
+    Returns:
+        Tuple[Optional[int], Optional[int]]: (start_ns, end_ns)
+    """
+    if window is None:
+        return None, None
+    start, end = window
+    return (None if start is None else to_epoch_ns(start, tz),
+            None if end is None else to_epoch_ns(end, tz))
+
+
+def read_csv_window(file_path: str, window: Optional[TimeWindow], source_tz: str,
+                    tz: str = TIMEZONE_SD, fmt: Optional[str] = None, **read_csv_kwargs) -> pd.DataFrame:
+    """
+    pd.read_csv over only the rows of a time-sorted CSV that fall in window.
+    
+    Without a window the whole file is parsed. With one, find_window_byte_range
+    locates the rows and only those bytes are read and parsed.
+    
+    Args:
+        file_path (str): Path to the time-sorted CSV file (timestamp in the first column)
+        window (tuple, optional): (start, end) bounds, naive bounds are in tz
+        source_tz (str): Time zone of naive timestamps in the file
+        tz (str): Time zone assumed for naive bounds (default: America/Los_Angeles)
+        fmt (str, optional): Timestamp format used to locate the window (detected if None)
+        **read_csv_kwargs: Passed to pd.read_csv (header/names are set here)
+    
+    Returns:
+        pd.DataFrame: The parsed rows
+    """
+    header = read_header_line(file_path)
+    names = read_csv_kwargs.pop('names', None) or [name.strip() for name in header.split(',')]
+    if window is None:
+        return pd.read_csv(file_path, header=0, names=names, encoding='utf-8-sig', **read_csv_kwargs)
+    
+    start_ns, end_ns = window_to_epoch_ns(window, tz)
+    first, stop = find_window_byte_range(file_path, start_ns, end_ns, source_tz, fmt)
+    logger.info(f"Window {window[0]} to {window[1]}: parsing bytes {first} to {stop} "
+                f"of {os.path.getsize(file_path)}")
+    with open(file_path, 'rb') as f:
+        f.seek(first)
+        data = f.read(stop - first)
+    if not data:
+        return pd.DataFrame({name: pd.Series(dtype=read_csv_kwargs.get('dtype', {}).get(name, object))
+                             for name in names})
+    return pd.read_csv(io.BytesIO(data), header=None, names=names, **read_csv_kwargs)
+
+
+def parse_export_csv(file_path: str, source_tz: str = 'UTC', window: Optional[TimeWindow] = None,
+                     tz: str = TIMEZONE_SD) -> dict:
+    """
+    Parse a DataExport CSV into typed columns.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        source_tz (str): Time zone of the export's timestamps (default: UTC)
+        window (tuple, optional): (start, end) bounds; only rows inside are parsed
+        tz (str): Time zone assumed for naive window bounds (default: America/Los_Angeles)
+    
+    Returns:
+        dict: {'timestamp_ns': int64 array, 'channels': {name: float32 array}}
+    
+    Raises:
+        ExportDataError: If the file cannot be parsed
+    """
+    header = read_header_line(file_path)
+    names = [name.strip() for name in header.split(',')]
+    if len(names) < 2:
+        raise ExportDataError(f"Expected a timestamp column and at least one channel in {file_path}")
+    
+    logger.info(f"Parsing export CSV: {file_path}")
+    fmt = detect_file_timestamp_format(file_path)
+    try:
+        df = read_csv_window(
+            file_path, window, source_tz, tz, fmt,
+            names=names,
+            dtype={name: np.float32 for name in names[1:]} | {names[0]: str},
+        )
+    except (ValueError, pd.errors.ParserError) as e:
+        raise ExportDataError(f"Failed to parse export CSV {file_path}: {e}")
+    
+    return {
+        'timestamp_ns': timestamps_to_epoch_ns(df[names[0]], source_tz, fmt),
+        'channels': {name: df[name].to_numpy(dtype=np.float32) for name in names[1:]},
+    }
+
+
+def split_byte_ranges(file_path: str, parts: int) -> list:
+    """
+    Split the data lines of a CSV (after the header) into newline-aligned byte ranges.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        parts (int): Number of ranges wanted
+    
+    Returns:
+        list: [(first, stop), ...] byte ranges covering every data line once, in order
+    """
+    size = os.path.getsize(file_path)
+    with open(file_path, 'rb') as f:
+        f.readline()
+        data_start = f.tell()
+        bounds = [data_start]
+        for i in range(1, parts):
+            offset = data_start + (size - data_start) * i // parts
+            f.seek(max(offset - 1, data_start))
+            f.readline()
+            bounds.append(max(f.tell(), bounds[-1]))
+        bounds.append(size)
+    return [(first, stop) for first, stop in zip(bounds[:-1], bounds[1:]) if stop > first]
+
+
+def _count_range_rows(file_path: str, first: int, stop: int) -> int:
+    """Number of non-blank lines in a byte range (worker for parse_export_csv_parallel)."""
+    with open(file_path, 'rb') as f:
+        f.seek(first)
+        data = f.read(stop - first)
+    return sum(1 for line in data.splitlines() if line.strip())
+
+
+def attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to a shared memory block owned (and unlinked) by another process.
+    
+    The owner is the only process that manages the block's lifetime. From
+    Python 3.13 the worker attaches with track=False and never registers it.
+    Older versions always register on attach; the owner therefore starts its
+    resource tracker before forking (start_resource_tracker), so the workers
+    share it, their registration of an already-registered name is a no-op
+    and the owner's unlink() unregisters the block once. Workers must not
+    unregister it themselves, which would drop the owner's entry.
+    
+    Args:
+        name (str): Name of the existing block
+    
+    Returns:
+        shared_memory.SharedMemory: The attached block (close it, do not unlink)
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def importable_by_workers(func) -> bool:
+    """
+    Whether worker processes can unpickle func, i.e. find it by module name.
+    
+    The utils are hyphenated files loaded by path; a module loaded with
+    spec_from_file_location/exec_module is importable by name only if it was
+    registered in sys.modules before exec_module.
+    
+    Args:
+        func (callable): Module-level function to run in a worker
+    
+    Returns:
+        bool: True if sys.modules resolves func's module and name to func itself
+    """
+    module = sys.modules.get(func.__module__)
+    return getattr(module, func.__qualname__, None) is func
+
+
+def start_resource_tracker() -> None:
+    """
+    Start the multiprocessing resource tracker in the owner before forking workers.
+    
+    Forked workers then inherit it instead of each starting their own, which
+    would unlink (or report as leaked) every block they attach when they exit.
+    """
+    from multiprocessing import resource_tracker
+    resource_tracker.ensure_running()
+
+
+def _parse_range_into_shared(file_path: str, first: int, stop: int, names: list, source_tz: str, fmt: str,
+                             timestamp_shm: str, channels_shm: str, row_offset: int, total_rows: int) -> int:
+    """Parse one byte range and write its rows into the shared columns (worker)."""
+    with open(file_path, 'rb') as f:
+        f.seek(first)
+        data = f.read(stop - first)
+    df = pd.read_csv(io.BytesIO(data), header=None, names=names,
+                     dtype={name: np.float32 for name in names[1:]} | {names[0]: str})
+    rows = len(df)
+    
+    ts_block = attach_shared_memory(timestamp_shm)
+    ch_block = attach_shared_memory(channels_shm)
+    try:
+        timestamps = np.ndarray((total_rows,), dtype=np.int64, buffer=ts_block.buf)
+        channels = np.ndarray((len(names) - 1, total_rows), dtype=np.float32, buffer=ch_block.buf)
+        timestamps[row_offset:row_offset + rows] = timestamps_to_epoch_ns(df[names[0]], source_tz, fmt)
+        channels[:, row_offset:row_offset + rows] = df[names[1:]].to_numpy(dtype=np.float32).T
+        del timestamps, channels
+    finally:
+        ts_block.close()
+        ch_block.close()
+    return rows
+
+
+def parse_export_csv_parallel(file_path: str, source_tz: str = 'UTC', workers: Optional[int] = None) -> dict:
+    """
+    Parse a Waveform/Phasor DataExport CSV on multiple processes.
+    
+    The data lines are split into one newline-aligned byte range per worker.
+    Rows per range are counted first so that the output can be allocated once
+    in shared memory (int64 timestamps, float32 channels); each worker then
+    parses its range with fixed dtypes and writes the rows at its offset, so
+    the results are assembled in order without pickling any arrays back.
+    When loaded by path, this module must be registered in sys.modules (see
+    PARALLEL PARSING) for the workers to find their task functions; if it is
+    not, the file is parsed in one process.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        source_tz (str): Time zone of the export's timestamps (default: UTC)
+        workers (int, optional): Worker processes (default: os.cpu_count())
+    
+    Returns:
+        dict: {'timestamp_ns': int64 array, 'channels': {name: float32 array}}
+    
+    Raises:
+        ExportDataError: If the file cannot be parsed
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or 'fork' not in multiprocessing.get_all_start_methods():
+        if workers > 1:
+            logger.warning("Parallel parsing needs the 'fork' start method; parsing in one process")
+        return parse_export_csv(file_path, source_tz)
+    if not importable_by_workers(_parse_range_into_shared):
+        logger.warning(f"Module {__name__} is not registered in sys.modules, so workers cannot import it; "
+                       f"parsing in one process")
+        return parse_export_csv(file_path, source_tz)
+    
+    header = read_header_line(file_path)
+    names = [name.strip() for name in header.split(',')]
+    if len(names) < 2:
+        raise ExportDataError(f"Expected a timestamp column and at least one channel in {file_path}")
+    
+    ranges = split_byte_ranges(file_path, workers)
+    if not ranges:
+        return parse_export_csv(file_path, source_tz)
+    fmt = detect_file_timestamp_format(file_path)
+    logger.info(f"Parsing export CSV on {workers} processes ({len(ranges)} byte ranges): {file_path}")
+    start_resource_tracker()
+    context = multiprocessing.get_context('fork')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        counts = list(executor.map(_count_range_rows, [file_path] * len(ranges),
+                                   [first for first, _ in ranges], [stop for _, stop in ranges]))
+        total_rows = sum(counts)
+        offsets = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype(int).tolist()
+        
+        ts_block = shared_memory.SharedMemory(create=True, size=max(total_rows * 8, 1))
+        ch_block = shared_memory.SharedMemory(create=True, size=max(total_rows * 4 * (len(names) - 1), 1))
+        try:
+            futures = [
+                executor.submit(_parse_range_into_shared, file_path, first, stop, names, source_tz, fmt,
+                                ts_block.name, ch_block.name, offset, total_rows)
+                for (first, stop), offset in zip(ranges, offsets)
+            ]
+            try:
+                parsed = [future.result() for future in futures]
+            except (ValueError, pd.errors.ParserError) as e:
+                raise ExportDataError(f"Failed to parse export CSV {file_path}: {e}")
+            if parsed != counts:
+                raise ExportDataError(f"Row count mismatch while parsing {file_path}: expected {counts}, parsed {parsed}")
+            
+            # Copy out so the shared blocks can be released
+            timestamps = np.ndarray((total_rows,), dtype=np.int64, buffer=ts_block.buf).copy()
+            channels = np.ndarray((len(names) - 1, total_rows), dtype=np.float32, buffer=ch_block.buf).copy()
+        finally:
+            ts_block.close()
+            ts_block.unlink()
+            ch_block.close()
+            ch_block.unlink()
+    
+    return {
+        'timestamp_ns': timestamps,
+        'channels': {name: channels[i] for i, name in enumerate(names[1:])},
+    }
+
+
+def write_export_cache(cache_dir: str, key: dict, columns: dict) -> None:
+    """
+    Store parsed export columns as .npy files in cache_dir.
+    
+    meta.json is written last (via a temporary file and rename), so a partially
+    written cache is never mistaken for a valid one.
+    
+    Args:
+        cache_dir (str): Cache directory
+        key (dict): Cache key from export_cache_key
+        columns (dict): Columns as returned by parse_export_csv
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    meta_path = os.path.join(cache_dir, 'meta.json')
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+    np.save(os.path.join(cache_dir, 'timestamp_ns.npy'), columns['timestamp_ns'])
+    names = list(columns['channels'])
+    for i, name in enumerate(names):
+        np.save(os.path.join(cache_dir, f'channel_{i}.npy'), columns['channels'][name])
+    tmp_path = meta_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'key': key, 'channels': names}, f, indent=2)
+    os.replace(tmp_path, meta_path)
+
+
+def read_export_cache(cache_dir: str, key: dict) -> Optional[dict]:
+    """
+    Open cached export columns memory-mapped, if the cache matches the key.
+    
+    Args:
+        cache_dir (str): Cache directory
+        key (dict): Expected cache key
+    
+    Returns:
+        Optional[dict]: Columns as returned by parse_export_csv, or None on a cache miss
+    """
+    meta_path = os.path.join(cache_dir, 'meta.json')
+    if not os.path.exists(meta_path):
+        return None
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('key') != key:
+            return None
+        return {
+            'timestamp_ns': np.load(os.path.join(cache_dir, 'timestamp_ns.npy'), mmap_mode='r'),
+            'channels': {
+                name: np.load(os.path.join(cache_dir, f'channel_{i}.npy'), mmap_mode='r')
+                for i, name in enumerate(meta['channels'])
+            },
+        }
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Ignoring unreadable export cache {cache_dir}: {e}")
+        return None
+
+
+def slice_columns(columns: dict, start_ns: Optional[int], end_ns: Optional[int]) -> dict:
+    """
+    Restrict typed columns to start_ns <= t <= end_ns by binary search (views, no copy).
+    
+    Args:
+        columns (dict): Columns as returned by load_export_columns (time-sorted)
+        start_ns (int, optional): Window start in UTC epoch ns
+        end_ns (int, optional): Window end in UTC epoch ns, inclusive
+    
+    Returns:
+        dict: Columns of the same layout covering only the window
+    """
+    timestamps = columns['timestamp_ns']
+    first = 0 if start_ns is None else int(np.searchsorted(timestamps, start_ns, side='left'))
+    stop = len(timestamps) if end_ns is None else int(np.searchsorted(timestamps, end_ns, side='right'))
+    return {
+        'timestamp_ns': timestamps[first:stop],
+        'channels': {name: values[first:stop] for name, values in columns['channels'].items()},
+    }
+
+
+def load_export_columns(file_path: str, source_tz: str = 'UTC', use_cache: bool = True,
+                        cache_dir: Optional[str] = None, window: Optional[TimeWindow] = None,
+                        tz: str = TIMEZONE_SD, workers: Optional[int] = None) -> dict:
+    """
+    Load a DataExport CSV as typed columns, through the binary cache.
+    
+    The first load parses the CSV and writes the cache; later loads of the
+    unchanged file memory-map the cached columns instead of parsing. A windowed
+    load with no valid cache parses only the window and does not write a cache.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        source_tz (str): Time zone of the export's timestamps (default: UTC)
+        use_cache (bool): Read and write the binary cache (default: True)
+        cache_dir (str, optional): Cache directory (default: '<file>.cache')
+        window (tuple, optional): (start, end) bounds, both inclusive
+        tz (str): Time zone assumed for naive window bounds (default: America/Los_Angeles)
+        workers (int, optional): Parse a full file on this many processes
+            (parse_export_csv_parallel); default: single process
+    
+    Returns:
+        dict: {'timestamp_ns': int64 array, 'channels': {name: float32 array}}
+    
+    Raises:
+        ExportDataError: If the file cannot be read or parsed
+    """
+    def parse_full():
+        if workers and workers > 1:
+            return parse_export_csv_parallel(file_path, source_tz, workers)
+        return parse_export_csv(file_path, source_tz)
+    
+    if not use_cache and window is None:
+        return parse_full()
+    if not use_cache:
+        return parse_export_csv(file_path, source_tz, window, tz)
+    
+    cache_dir = cache_dir or file_path + EXPORT_CACHE_SUFFIX
+    key = export_cache_key(file_path, source_tz)
+    columns = read_export_cache(cache_dir, key)
+    if columns is not None:
+        logger.info(f"Loaded export from cache: {cache_dir}")
+        if window is not None:
+            columns = slice_columns(columns, *window_to_epoch_ns(window, tz))
+        return columns
+    
+    if window is not None:
+        return parse_export_csv(file_path, source_tz, window, tz)
+    
+    columns = parse_full()
+    try:
+        write_export_cache(cache_dir, key, columns)
+        logger.info(f"Wrote export cache: {cache_dir}")
+    except OSError as e:
+        logger.warning(f"Could not write export cache {cache_dir}: {e}")
+    return columns
+
+
+def columns_to_dataframe(columns: dict, tz: str = TIMEZONE_SD) -> pd.DataFrame:
+    """
+    Build a DataFrame indexed by 'timestamp' (converted to tz) from typed columns.
+    
+    Args:
+        columns (dict): Columns as returned by load_export_columns
+        tz (str): Display time zone (default: America/Los_Angeles)
+    
+    Returns:
+        pd.DataFrame: One float32 column per channel
+    """
+    return pd.DataFrame(columns['channels'], index=epoch_ns_to_index(columns['timestamp_ns'], tz), copy=False)
+
+
+def load_export_data(file_path: str, source_tz: str = 'UTC', tz: str = TIMEZONE_SD,
+                     use_cache: bool = True, cache_dir: Optional[str] = None,
+                     window: Optional[TimeWindow] = None, workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Load a DataExport CSV into a DataFrame indexed by timestamp.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        source_tz (str): Time zone of the export's timestamps (default: UTC)
+        tz (str): Time zone of the returned index (default: America/Los_Angeles)
+        use_cache (bool): Read and write the binary cache (default: True)
+        cache_dir (str, optional): Cache directory (default: '<file>.cache')
+        window (tuple, optional): (start, end) bounds, both inclusive; naive bounds are in tz
+        workers (int, optional): Processes for parsing a full file (default: one)
+    
+    Returns:
+        pd.DataFrame: One float32 column per channel, indexed by 'timestamp'
+    
+    Raises:
+        ExportDataError: If the file cannot be read or parsed
+    """
+    columns = load_export_columns(file_path, source_tz, use_cache, cache_dir, window, tz, workers)
+    df = columns_to_dataframe(columns, tz)
+    if len(df) > 0:
+        logger.info(f"Loaded {len(df)} rows, {len(df.columns)} channels, time range: {df.index[0]} to {df.index[-1]}")
+    return df
+
+
+def load_waveform_data(file_path: str, source_tz: str = 'UTC', tz: str = TIMEZONE_SD,
+                       use_cache: bool = True, cache_dir: Optional[str] = None,
+                       window: Optional[TimeWindow] = None, workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Load a Waveform DataExport CSV (high-rate voltage/current samples).
+    
+    Args:
+        file_path (str): Path to the DataExport_Waveform_*.CSV file
+        source_tz (str): Time zone of the export's timestamps (default: UTC)
+        tz (str): Time zone of the returned index (default: America/Los_Angeles)
+        use_cache (bool): Read and write the binary cache (default: True)
+        cache_dir (str, optional): Cache directory (default: '<file>.cache')
+        window (tuple, optional): (start, end) bounds, both inclusive; naive bounds are in tz
+        workers (int, optional): Processes for parsing a full file (default: one)
+    
+    Returns:
+        pd.DataFrame: One float32 column per channel, indexed by 'timestamp'
+    """
+    df = load_export_data(file_path, source_tz, tz, use_cache, cache_dir, window, workers)
+    if len(df) > 1:
+        logger.info(f"Sampling rate: ~{1.0 / (df.index[1] - df.index[0]).total_seconds():.1f} Hz")
+    return df
+
+
+def load_pmu_data(file_path: str, source_tz: str = 'UTC', tz: str = TIMEZONE_SD,
+                  use_cache: bool = True, cache_dir: Optional[str] = None,
+                  window: Optional[TimeWindow] = None, workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Load a Phasor DataExport CSV (PMU magnitudes, angles and power).
+    
+    Args:
+        file_path (str): Path to the DataExport_Phasor_*.CSV file
+        source_tz (str): Time zone of the export's timestamps (default: UTC)
+        tz (str): Time zone of the returned index (default: America/Los_Angeles)
+        use_cache (bool): Read and write the binary cache (default: True)
+        cache_dir (str, optional): Cache directory (default: '<file>.cache')
+        window (tuple, optional): (start, end) bounds, both inclusive; naive bounds are in tz
+        workers (int, optional): Processes for parsing a full file (default: one)
+    
+    Returns:
+        pd.DataFrame: One float32 column per channel, indexed by 'timestamp'
+    """
+    return load_export_data(file_path, source_tz, tz, use_cache, cache_dir, window, workers)
+
+
+def load_loadbank_data(file_path: str, source_tz: str = TIMEZONE_SD, tz: str = TIMEZONE_SD,
+                       window: Optional[TimeWindow] = None, workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Load a loadbank log (R/L/C setpoints over time), indexed by timestamp.
+    
+    Loadbank logs are written in local (San Diego) time and are small, so they
+    are not cached; a window still parses only the rows inside it.
+    
+    Args:
+        file_path (str): Path to the loadbank_log_*.csv file
+        source_tz (str): Time zone of the log's timestamps (default: America/Los_Angeles)
+        tz (str): Time zone of the returned index and of naive window bounds
+        window (tuple, optional): (start, end) bounds, both inclusive
+    
+    Returns:
+        pd.DataFrame: Log columns (e.g. 'resistive_kw (kW)'), indexed by 'timestamp'
+    
+    Raises:
+        ExportDataError: If the file cannot be read or parsed
+    """
+    header = read_header_line(file_path)
+    time_column = header.split(',')[0].strip()
+    fmt = detect_file_timestamp_format(file_path)
+    try:
+        df = read_csv_window(file_path, window, source_tz, tz, fmt, dtype={time_column: str})
+    except (ValueError, pd.errors.ParserError) as e:
+        raise ExportDataError(f"Failed to parse loadbank log {file_path}: {e}")
+    timestamp_ns = timestamps_to_epoch_ns(df[time_column], source_tz, fmt)
+    df = df.drop(columns=[time_column])
+    df.index = epoch_ns_to_index(timestamp_ns, tz)
+    logger.info(f"Loaded {len(df)} loadbank rows from {file_path}")
+    return df
+
+
+def sniff_export_format(file_path: str) -> str:
+    """
+    Identify the export family of a file.
+    
+    The file name is matched against each EXPORT_FORMATS pattern first; if
+    none matches, the header is searched for each family's header keywords.
+    
+    Args:
+        file_path (str): Path to the export file
+    
+    Returns:
+        str: Key into EXPORT_FORMATS
+    
+    Raises:
+        ExportDataError: If the file matches no registered family
+    """
+    file_name = os.path.basename(file_path)
+    for name, spec in EXPORT_FORMATS.items():
+        if re.match(spec['pattern'], file_name, re.IGNORECASE):
+            return name
+    
+    header_row, columns = read_header_columns(file_path)
+    header = ','.join(columns).lower()
+    for name, spec in EXPORT_FORMATS.items():
+        if spec['header'] and all(keyword in header for keyword in spec['header']):
+            return name
+    raise ExportDataError(f"Unrecognized export format: {file_path}")
+
+
+def read_header_columns(file_path: str) -> Tuple[int, list]:
+    """
+    Locate the header row of a CSV export and return its column names.
+    
+    The header is the first of the first HEADER_SCAN_LINES lines that has a
+    time/date-like column; if none does, the first line is used.
+    
+    Args:
+        file_path (str): Path to the CSV file
+    
+    Returns:
+        tuple: (header row number, list of stripped column names)
+    
+    Raises:
+        ExportDataError: If the file is missing or empty
+    """
+    read_header_line(file_path)
+    with open(file_path, 'r', encoding='utf-8-sig', errors='replace') as f:
+        lines = [line.rstrip('\r\n') for _, line in zip(range(HEADER_SCAN_LINES), f)]
+    for row, line in enumerate(lines):
+        columns = [name.strip().strip('"') for name in line.split(',')]
+        if find_time_column(columns) is not None:
+            return row, columns
+    return 0, [name.strip().strip('"') for name in lines[0].split(',')]
+
+
+def find_time_column(columns: Sequence[str]) -> Optional[str]:
+    """
+    First column whose name looks like a timestamp ('time', 'date' or 'timestamp').
+    
+    Args:
+        columns (Sequence[str]): Column names
+    
+    Returns:
+        str or None: The column name, or None if there is no such column
+    """
+    for name in columns:
+        if re.search(r'time|date', name, re.IGNORECASE):
+            return name
+    return None
+
+
+def load_typed_export(file_path: str, usecols: Optional[Sequence[str]] = None,
+                      format_name: Optional[str] = None, source_tz: Optional[str] = None,
+                      tz: str = TIMEZONE_SD) -> pd.DataFrame:
+    """
+    Load the requested columns of any registered export family with fixed dtypes.
+    
+    Only the time column and usecols are parsed; every other column is
+    skipped by the C parser. Numeric columns are read straight into the
+    family's dtype (float32), with the family's na_values placeholders read
+    as NaN, so a wide export costs a fraction of the object-column parse in
+    both time and memory.
+    
+    Args:
+        file_path (str): Path to the export file
+        usecols (Sequence[str], optional): Columns to load (default: all)
+        format_name (str, optional): Key into EXPORT_FORMATS (default: sniffed)
+        source_tz (str, optional): Time zone of naive timestamps (default: the family's)
+        tz (str): Time zone of the returned index (default: America/Los_Angeles)
+    
+    Returns:
+        pd.DataFrame: The requested columns, indexed by 'timestamp'
+    
+    Raises:
+        ExportDataError: If the format is unknown, a column is missing or parsing fails
+    """
+    format_name = format_name or sniff_export_format(file_path)
+    if format_name not in EXPORT_FORMATS:
+        raise ExportDataError(f"Unknown export format '{format_name}'. "
+                              f"Supported formats: {list(EXPORT_FORMATS.keys())}")
+    spec = EXPORT_FORMATS[format_name]
+    source_tz = source_tz or spec['source_tz']
+    
+    header_row, columns = read_header_columns(file_path)
+    time_column = spec['time_column'] or find_time_column(columns) or columns[0]
+    if usecols is None:
+        usecols = [name for name in columns if name and name != time_column]
+    missing = [name for name in [time_column, *usecols] if name not in columns]
+    if missing:
+        raise ExportDataError(f"Columns {missing} not found in {file_path}. "
+                              f"Available columns: {columns}")
+    
+    dtype = {name: spec['dtype'] for name in usecols} | {time_column: str}
+    read_kwargs = dict(skiprows=header_row + 1, header=None, names=columns,
+                       usecols=[time_column, *usecols], encoding='utf-8-sig', skipinitialspace=True)
+    logger.info(f"Loading {len(usecols)} column(s) of {format_name} export: {file_path}")
+    try:
+        df = pd.read_csv(file_path, dtype=dtype, na_values=list(spec['na_values']), **read_kwargs)
+    except (ValueError, pd.errors.ParserError) as e:
+        raise ExportDataError(f"Failed to parse {format_name} export {file_path}: {e} "
+                              f"(non-numeric columns can be left out with usecols)")
+    
+    df = df.dropna(subset=[time_column])
+    timestamp_ns = timestamps_to_epoch_ns(df[time_column], source_tz)
+    df = df.drop(columns=[time_column])
+    df.index = epoch_ns_to_index(timestamp_ns, tz)
+    return df
+
+
+def parse_event_values(values: pd.Series, formats: Sequence[str], kind: str = 'values',
+                       default_year: int = EVENT_DEFAULT_YEAR) -> pd.DatetimeIndex:
+    """
+    Parse event log date or time strings that may mix several formats.
+    
+    Hand-written logs switch formats between rows (e.g. '9:05' next to
+    '10:15:30'), so instead of detecting one format per file each candidate
+    is applied in order, vectorized with errors='coerce', to the rows still
+    unparsed. Rows that no candidate parses are an error (never left as
+    NaT), and a mix of formats is logged with the row count of each.
+    
+    Args:
+        values (pd.Series): Date or time strings (no blanks)
+        formats (Sequence[str]): Candidate strftime formats, in order of preference
+        kind (str): What the values are, for error messages (default: 'values')
+        default_year (int): Year for formats without one, e.g. '31-Oct' (default: 2025)
+    
+    Returns:
+        pd.DatetimeIndex: Parsed values, in the order given
+    
+    Raises:
+        ExportDataError: If some values match none of the formats
+    """
+    values = pd.Series(values, dtype=object).str.strip().reset_index(drop=True)
+    parsed = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+    used = {}
+    for fmt in formats:
+        missing = parsed.isna()
+        if not missing.any():
+            break
+        pending = values[missing]
+        full_format = fmt
+        if '%Y' not in fmt:
+            pending = pending + f'-{default_year}'
+            full_format = fmt + '-%Y'
+        result = pd.to_datetime(pending, format=full_format, errors='coerce').astype('datetime64[ns]')
+        parsed[missing] = result
+        if result.notna().any():
+            used[fmt] = int(result.notna().sum())
+    
+    unparsed = values[parsed.isna()]
+    if len(unparsed):
+        raise ExportDataError(f"Unrecognized event log {kind} in {len(unparsed)} of {len(values)} row(s), "
+                              f"e.g. {unparsed.iloc[:3].tolist()}")
+    if len(used) > 1:
+        logger.info(f"Event log {kind} mix formats: " + ', '.join(f"'{fmt}' ({n} rows)" for fmt, n in used.items()))
+    return pd.DatetimeIndex(parsed)
+
+
+def event_times_to_epoch_ns(dates: pd.Series, times: Optional[pd.Series], source_tz: str = TIMEZONE_SD,
+                            default_year: int = EVENT_DEFAULT_YEAR) -> np.ndarray:
+    """
+    Convert event log date and time-of-day columns to int64 UTC epoch nanoseconds.
+    
+    Dates and times are each parsed with parse_event_values (one vectorized
+    call per candidate format) and the two are added together. Times in the
+    repeated fall-back DST hour are resolved from the row order (daylight
+    time first, then standard time), so no event becomes NaT.
+    
+    Args:
+        dates (pd.Series): Date strings (no blanks; see load_event_log)
+        times (pd.Series, optional): Time-of-day strings; None for date-only logs
+        source_tz (str): Time zone of the log (default: America/Los_Angeles)
+        default_year (int): Year for formats without one, e.g. '31-Oct' (default: 2025)
+    
+    Returns:
+        np.ndarray: int64 UTC epoch nanoseconds
+    
+    Raises:
+        ExportDataError: If some dates or times match no known format
+    """
+    day = parse_event_values(dates, EVENT_DATE_FORMATS, 'dates', default_year)
+    
+    if times is not None:
+        times = pd.Series(times, dtype=object).fillna('').str.strip()
+        filled = times != ''
+        offset = np.zeros(len(times), dtype='timedelta64[ns]')
+        if filled.any():
+            clock = parse_event_values(times[filled], EVENT_TIME_FORMATS, 'times')
+            offset[filled.to_numpy()] = (clock - clock.normalize()).to_numpy()
+        day = day + pd.TimedeltaIndex(offset)
+    
+    try:
+        # Rows are in log order, so a repeated fall-back hour resolves to DST then standard time
+        day = day.tz_localize(source_tz, ambiguous='infer', nonexistent='shift_forward')
+    except ValueError:
+        ambiguous = day.tz_localize(source_tz, ambiguous='NaT', nonexistent='shift_forward').isna()
+        logger.warning(f"{int(ambiguous.sum())} event(s) in the repeated fall-back hour cannot be ordered; "
+                       f"taking them as daylight time")
+        day = day.tz_localize(source_tz, ambiguous=np.ones(len(day), dtype=bool), nonexistent='shift_forward')
+    return day.tz_convert('UTC').tz_localize(None).as_unit('ns').asi8
+
+
+def load_event_log(file_path: str, source_tz: str = TIMEZONE_SD, tz: str = TIMEZONE_SD) -> pd.DataFrame:
+    """
+    Load an event_log_test_*.csv file, indexed by timestamp and sorted by time.
+    
+    The log may hold a combined date/time column or separate 'Date' and
+    'Time' columns. Rows without a date take the previous row's date; rows
+    with no date at all are dropped. Formats are matched per row rather than
+    once per file (parse_event_values), since hand-written logs mix them
+    (e.g. '9:05' and '10:15:30'); a date or time that matches no format in
+    EVENT_DATE_FORMATS / EVENT_TIME_FORMATS raises ExportDataError.
+    
+    Args:
+        file_path (str): Path to the event log
+        source_tz (str): Time zone of the log (default: America/Los_Angeles)
+        tz (str): Time zone of the returned index (default: America/Los_Angeles)
+    
+    Returns:
+        pd.DataFrame: Event columns as text, indexed by 'timestamp'
+    
+    Raises:
+        ExportDataError: If the file cannot be read or its dates parsed
+    """
+    header_row, columns = read_header_columns(file_path)
+    try:
+        df = pd.read_csv(file_path, skiprows=header_row + 1, header=None, names=columns, dtype=str,
+                         encoding='utf-8-sig', skip_blank_lines=True)
+    except (ValueError, pd.errors.ParserError) as e:
+        raise ExportDataError(f"Failed to parse event log {file_path}: {e}")
+    
+    date_column = next((name for name in columns if re.search(r'date', name, re.IGNORECASE)), None)
+    time_column = next((name for name in columns
+                        if re.search(r'time', name, re.IGNORECASE) and name != date_column), None)
+    if date_column is None:
+        date_column = time_column or columns[0]
+        time_column = None
+    
+    dates = df[date_column].str.strip().replace('', np.nan)
+    if time_column is None:
+        # Combined column: '2.13.2026 14:31:12' splits into date and time parts
+        parts = dates.str.split(n=1, expand=True)
+        dates = parts[0]
+        times = parts[1] if parts.shape[1] > 1 else None
+    else:
+        times = df[time_column]
+    dates = dates.ffill()
+    keep = dates.notna().to_numpy()
+    df, dates = df[keep], dates[keep]
+    times = None if times is None else times[keep]
+    
+    timestamp_ns = event_times_to_epoch_ns(dates, times, source_tz)
+    df = df.drop(columns=[name for name in (date_column, time_column) if name is not None])
+    order = np.argsort(timestamp_ns, kind='stable')
+    df = df.iloc[order]
+    df.index = epoch_ns_to_index(timestamp_ns[order], tz)
+    logger.info(f"Loaded {len(df)} events from {file_path}")
+    return df
+
+
+class EventIndex:
+    """
+    Time-sorted events from one or more event logs with range lookups.
+    
+    Events are kept in a DataFrame sorted by timestamp, alongside the int64
+    UTC epoch nanoseconds of each row, so between() is two binary searches.
+    
+    Attributes:
+        events (pd.DataFrame): Events indexed by 'timestamp'; a 'source' column names the log file
+        times_ns (np.ndarray): Sorted int64 UTC epoch nanoseconds of the rows of events
+        tz (str): Time zone of naive lookup bounds and of the events index
+    """
+    
+    def __init__(self, events: pd.DataFrame, tz: str = TIMEZONE_SD):
+        """
+        Index already-loaded events (a DataFrame indexed by a timezone-aware 'timestamp').
+        
+        Args:
+            events (pd.DataFrame): Events, e.g. from load_event_log
+            tz (str): Time zone of naive lookup bounds (default: America/Los_Angeles)
+        """
+        times_ns = events.index.tz_convert('UTC').tz_localize(None).as_unit('ns').asi8
+        order = np.argsort(times_ns, kind='stable')
+        self.events = events.iloc[order]
+        self.times_ns = times_ns[order]
+        self.tz = tz
+    
+    @classmethod
+    def from_file(cls, file_path: str, source_tz: str = TIMEZONE_SD, tz: str = TIMEZONE_SD) -> 'EventIndex':
+        """Index the events of one event log."""
+        return cls.from_files([file_path], source_tz, tz)
+    
+    @classmethod
+    def from_files(cls, file_paths: Sequence[str], source_tz: str = TIMEZONE_SD,
+                   tz: str = TIMEZONE_SD) -> 'EventIndex':
+        """
+        Index the events of many event logs (e.g. every data_test_* folder) together.
+        
+        Args:
+            file_paths (Sequence[str]): Paths to event_log_test_*.csv files
+            source_tz (str): Time zone of the logs (default: America/Los_Angeles)
+            tz (str): Time zone of the events index and of naive lookup bounds
+        
+        Returns:
+            EventIndex: The combined index
+        """
+        frames = []
+        for file_path in file_paths:
+            df = load_event_log(file_path, source_tz, tz)
+            df.insert(0, 'source', os.path.basename(file_path))
+            frames.append(df)
+        if not frames:
+            raise ExportDataError("No event logs given")
+        return cls(pd.concat(frames), tz)
+    
+    def __len__(self) -> int:
+        return len(self.times_ns)
+    
+    def between(self, t0: Optional[Union[datetime, pd.Timestamp, str]] = None,
+                t1: Optional[Union[datetime, pd.Timestamp, str]] = None) -> pd.DataFrame:
+        """
+        Events with t0 <= timestamp <= t1 (naive bounds are in tz; None is unbounded).
+        
+        Args:
+            t0 (datetime, pd.Timestamp or str, optional): Start of the range
+            t1 (datetime, pd.Timestamp or str, optional): End of the range
+        
+        Returns:
+            pd.DataFrame: The matching events, in time order
+        """
+        first, stop = self.range_indices(t0, t1)
+        return self.events.iloc[first:stop]
+    
+    def range_indices(self, t0: Optional[Union[datetime, pd.Timestamp, str]] = None,
+                      t1: Optional[Union[datetime, pd.Timestamp, str]] = None) -> Tuple[int, int]:
+        """Row range [first, stop) of the events with t0 <= timestamp <= t1."""
+        start_ns, end_ns = window_to_epoch_ns((t0, t1), self.tz)
+        first = 0 if start_ns is None else int(np.searchsorted(self.times_ns, start_ns, side='left'))
+        stop = len(self.times_ns) if end_ns is None else int(np.searchsorted(self.times_ns, end_ns, side='right'))
+        return first, max(first, stop)
+
+
+class LoadbankTimeline:
+    """
+    Step function of loadbank R/L/C setpoints merged from one or more logs.
+    
+    Rows from all logs are sorted by int64 UTC time; a row whose time is
+    already present (overlapping logs) is dropped, as is a row that repeats
+    the previous setpoints, so each row marks a setpoint change.
+    
+    Attributes:
+        times_ns (np.ndarray): Sorted int64 UTC epoch ns at which each setpoint took effect
+        setpoints (np.ndarray): float32 array (len(times_ns), len(columns)) of setpoints
+        columns (tuple): Setpoint column names
+        tz (str): Time zone of naive lookup times and of to_dataframe()
+    """
+    
+    def __init__(self, times_ns: np.ndarray, setpoints: np.ndarray,
+                 columns: Sequence[str] = LOADBANK_SETPOINT_COLUMNS, tz: str = TIMEZONE_SD):
+        """
+        Build a timeline from raw rows (any order, duplicates allowed).
+        
+        Args:
+            times_ns (np.ndarray): int64 UTC epoch ns of each row
+            setpoints (np.ndarray): Setpoints, one row per time and one column per name in columns
+            columns (Sequence[str]): Setpoint column names (default: R/L/C loadbank columns)
+            tz (str): Time zone of naive lookup times (default: America/Los_Angeles)
+        """
+        times_ns = np.asarray(times_ns, dtype=np.int64)
+        setpoints = np.asarray(setpoints, dtype=np.float32).reshape(len(times_ns), len(columns))
+        order = np.argsort(times_ns, kind='stable')
+        times_ns, setpoints = times_ns[order], setpoints[order]
+        
+        keep = np.ones(len(times_ns), dtype=bool)
+        if len(times_ns) > 1:
+            keep[1:] = times_ns[1:] != times_ns[:-1]
+            kept = np.flatnonzero(keep)
+            # Compare with the previous kept row; NaN == NaN counts as unchanged
+            previous, current = setpoints[kept[:-1]], setpoints[kept[1:]]
+            unchanged = ((previous == current) | (np.isnan(previous) & np.isnan(current))).all(axis=1)
+            keep[kept[1:][unchanged]] = False
+        
+        self.times_ns = times_ns[keep]
+        self.setpoints = setpoints[keep]
+        self.columns = tuple(columns)
+        self.tz = tz
+    
+    @classmethod
+    def from_files(cls, file_paths: Sequence[str], source_tz: str = TIMEZONE_SD, tz: str = TIMEZONE_SD,
+                   columns: Sequence[str] = LOADBANK_SETPOINT_COLUMNS) -> 'LoadbankTimeline':
+        """
+        Merge the setpoint columns of several loadbank logs.
+        
+        Args:
+            file_paths (Sequence[str]): Paths to loadbank_log_*.csv files
+            source_tz (str): Time zone of the logs (default: America/Los_Angeles)
+            tz (str): Time zone of naive lookup times (default: America/Los_Angeles)
+            columns (Sequence[str]): Setpoint columns to load (default: R/L/C)
+        
+        Returns:
+            LoadbankTimeline: The merged timeline
+        
+        Raises:
+            ExportDataError: If no logs are given or a log cannot be loaded
+        """
+        if not file_paths:
+            raise ExportDataError("No loadbank logs given")
+        times, values = [], []
+        for file_path in file_paths:
+            df = load_typed_export(file_path, usecols=list(columns), format_name='loadbank', source_tz=source_tz)
+            times.append(df.index.tz_convert('UTC').tz_localize(None).as_unit('ns').asi8)
+            values.append(df.to_numpy(dtype=np.float32))
+        timeline = cls(np.concatenate(times), np.concatenate(values), columns, tz)
+        logger.info(f"Loadbank timeline: {len(timeline)} setpoint changes from {len(file_paths)} log(s)")
+        return timeline
+    
+    @classmethod
+    def from_folder(cls, folder: str, source_tz: str = TIMEZONE_SD, tz: str = TIMEZONE_SD,
+                    columns: Sequence[str] = LOADBANK_SETPOINT_COLUMNS) -> 'LoadbankTimeline':
+        """Merge every loadbank_log*.csv file in a test folder (see from_files)."""
+        file_paths = sorted(os.path.join(folder, name) for name in os.listdir(folder)
+                            if re.match(LOADBANK_LOG_PATTERN, name, re.IGNORECASE))
+        if not file_paths:
+            raise ExportDataError(f"No loadbank logs found in {folder}")
+        return cls.from_files(file_paths, source_tz, tz, columns)
+    
+    def __len__(self) -> int:
+        return len(self.times_ns)
+    
+    def setpoint_at(self, times) -> np.ndarray:
+        """
+        Setpoints in effect at each of times (the last change at or before it).
+        
+        Args:
+            times: int64 UTC epoch ns (array or scalar), or datetimes / a DatetimeIndex
+                (naive values are in tz)
+        
+        Returns:
+            np.ndarray: float32 array (len(times), len(columns)); NaN before the first row
+        """
+        rows = asof_indices(self._to_epoch_ns(times), self.times_ns)
+        result = np.full((len(rows), len(self.columns)), np.nan, dtype=np.float32)
+        valid = rows >= 0
+        result[valid] = self.setpoints[rows[valid]]
+        return result
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """Setpoint changes as a DataFrame indexed by 'timestamp' in tz."""
+        return pd.DataFrame(self.setpoints, columns=list(self.columns),
+                            index=epoch_ns_to_index(self.times_ns, self.tz))
+    
+    def _to_epoch_ns(self, times) -> np.ndarray:
+        if isinstance(times, np.ndarray) and np.issubdtype(times.dtype, np.integer):
+            return times.astype(np.int64).ravel()
+        if isinstance(times, (int, np.integer)):
+            return np.array([times], dtype=np.int64)
+        index = pd.DatetimeIndex(times if isinstance(times, (pd.Index, pd.Series, list, np.ndarray)) else [times])
+        if index.tz is None:
+            index = index.tz_localize(self.tz)
+        return index.tz_convert('UTC').tz_localize(None).as_unit('ns').asi8
+
+
+def list_evzip_entries(file_path: str) -> list:
+    """
+    List the CSV entries of an .evzip export archive.
+    
+    Args:
+        file_path (str): Path to the .evzip file
+    
+    Returns:
+        list: Entry names, in archive order
+    
+    Raises:
+        ExportDataError: If the file is missing or not a zip container
+    """
+    if not os.path.exists(file_path):
+        raise ExportDataError(f"Export file not found: {file_path}")
+    try:
+        with zipfile.ZipFile(file_path) as zf:
+            names = [info.filename for info in zf.infolist() if not info.is_dir()]
+    except zipfile.BadZipFile as e:
+        raise ExportDataError(f"Not a readable .evzip archive: {file_path}: {e}")
+    csv_names = [name for name in names if name.lower().endswith('.csv')]
+    return csv_names or names
+
+
+def read_evzip_export(file_path: str, channels: Optional[Sequence[str]] = None,
+                      start: Optional[Union[datetime, pd.Timestamp, str]] = None,
+                      end: Optional[Union[datetime, pd.Timestamp, str]] = None,
+                      source_tz: str = 'UTC', tz: str = TIMEZONE_SD,
+                      chunk_rows: int = EVZIP_CHUNK_ROWS) -> dict:
+    """
+    Stream typed columns out of an .evzip export without extracting it.
+    
+    CSV entries are decompressed on the fly and parsed in chunk_rows chunks
+    with fixed dtypes; only the selected channels are parsed and only rows in
+    [start, end] are kept. Exports are time-sorted, so reading stops at the
+    first chunk past end. Multiple CSV entries are read in archive order and
+    must share a header.
+    
+    Args:
+        file_path (str): Path to the .evzip file
+        channels (Sequence[str], optional): Channels to load (default: all)
+        start (datetime, optional): First time to include (naive times are in tz)
+        end (datetime, optional): Last time to include (naive times are in tz)
+        source_tz (str): Time zone of the export's timestamps (default: UTC)
+        tz (str): Time zone for naive start/end (default: America/Los_Angeles)
+        chunk_rows (int): Rows parsed per chunk (default: EVZIP_CHUNK_ROWS)
+    
+    Returns:
+        dict: {'timestamp_ns': int64 array, 'channels': {name: float32 array}}
+    
+    Raises:
+        ExportDataError: If the archive cannot be read or a channel is missing
+    """
+    start_ns = None if start is None else to_epoch_ns(start, tz)
+    end_ns = None if end is None else to_epoch_ns(end, tz)
+    entries = list_evzip_entries(file_path)
+    if not entries:
+        raise ExportDataError(f"No data entries in {file_path}")
+    
+    times = []
+    values = {}
+    names = None
+    fmt = None
+    done = False
+    with zipfile.ZipFile(file_path) as zf:
+        for entry in entries:
+            with zf.open(entry) as raw:
+                header = raw.readline().decode('utf-8-sig', errors='replace').rstrip('\r\n')
+                entry_names = [name.strip() for name in header.split(',')]
+                if names is None:
+                    names = entry_names
+                    selected = list(names[1:]) if channels is None else list(channels)
+                    missing = [name for name in selected if name not in names[1:]]
+                    if missing:
+                        raise ExportDataError(f"Channels not found in {file_path}: {missing}")
+                    values = {name: [] for name in selected}
+                elif entry_names != names:
+                    raise ExportDataError(f"Entry {entry} of {file_path} has a different header")
+                
+                try:
+                    reader = pd.read_csv(
+                        raw, header=None, names=names, usecols=[names[0]] + selected,
+                        dtype={name: np.float32 for name in selected} | {names[0]: str},
+                        chunksize=chunk_rows,
+                    )
+                    for chunk in reader:
+                        if fmt is None and len(chunk):
+                            fmt = detect_timestamp_format(chunk[names[0]].iloc[:TIMESTAMP_SAMPLE_SIZE].tolist())
+                        chunk_ns = timestamps_to_epoch_ns(chunk[names[0]], source_tz, fmt)
+                        keep = np.ones(len(chunk_ns), dtype=bool)
+                        if start_ns is not None:
+                            keep &= chunk_ns >= start_ns
+                        if end_ns is not None:
+                            keep &= chunk_ns <= end_ns
+                        if keep.any():
+                            times.append(chunk_ns[keep])
+                            for name in selected:
+                                values[name].append(chunk[name].to_numpy(dtype=np.float32)[keep])
+                        if end_ns is not None and len(chunk_ns) and chunk_ns[-1] > end_ns:
+                            done = True
+                            break
+                except (ValueError, pd.errors.ParserError, zipfile.BadZipFile) as e:
+                    raise ExportDataError(f"Failed to read entry {entry} of {file_path}: {e}")
+            if done:
+                break
+    
+    logger.info(f"Streamed {sum(len(t) for t in times)} rows, {len(values)} channels from {file_path}")
+    return {
+        'timestamp_ns': np.concatenate(times) if times else np.empty(0, dtype=np.int64),
+        'channels': {
+            name: np.concatenate(parts) if parts else np.empty(0, dtype=np.float32)
+            for name, parts in values.items()
+        },
+    }
+
+
+def load_evzip_data(file_path: str, channels: Optional[Sequence[str]] = None,
+                    start: Optional[Union[datetime, pd.Timestamp, str]] = None,
+                    end: Optional[Union[datetime, pd.Timestamp, str]] = None,
+                    source_tz: str = 'UTC', tz: str = TIMEZONE_SD) -> pd.DataFrame:
+    """
+    Load an .evzip export into a DataFrame indexed by timestamp (see read_evzip_export).
+    
+    Args:
+        file_path (str): Path to the .evzip file
+        channels (Sequence[str], optional): Channels to load (default: all)
+        start (datetime, optional): First time to include (naive times are in tz)
+        end (datetime, optional): Last time to include (naive times are in tz)
+        source_tz (str): Time zone of the export's timestamps (default: UTC)
+        tz (str): Time zone of the returned index and of naive start/end
+    
+    Returns:
+        pd.DataFrame: One float32 column per selected channel, indexed by 'timestamp'
+    """
+    columns = read_evzip_export(file_path, channels, start, end, source_tz, tz)
+    return columns_to_dataframe(columns, tz)
@@ -0,0 +1,1181 @@
+"""
+Harmonics Analysis Utilities
+
+This module computes time-varying harmonic magnitudes and THD from sampled
+waveforms (Phase A/B/C currents and voltages from the waveform DataExport
+CSVs). All windows of a capture are built at once as a strided view and
+transformed with a single batched FFT per block, so a multi-hour capture is
+processed without a Python loop over windows.
+
+USAGE EXAMPLES:
+    # Harmonic magnitudes for every 200 ms window of three phases
+    samples = np.vstack([df['IA'], df['IB'], df['IC']])       # (phases, samples)
+    magnitudes = compute_harmonic_spectrum(samples, sample_rate=7812.5)
+    magnitudes.shape                                           # (windows, phases, 50)
+    
+    # THD per window and phase, in percent
+    thd = thd_from_harmonics(magnitudes)                      # (windows, phases)
+    
+    # Long-format table like time_varying_harmonics_df (index 'timestamp', columns 'phase', 'thd', 'h1'...)
+    times = window_times(df.index[0], sample_rate, len(magnitudes), window_samples, hop_samples)
+    table = harmonics_to_dataframe(magnitudes, times, ['Phase A', 'Phase B', 'Phase C'])
+    
+    # Targeted DFT: only harmonics 1..50 via one matrix multiply (fast for short windows)
+    magnitudes = compute_harmonic_spectrum(samples, sample_rate, method='dft')
+    
+    # Streaming THD, updated every cycle, from chunks of any source (no FFT per hop)
+    tracker = SlidingHarmonicTracker(sample_rate, num_channels=3, start=t0)
+    for chunk in chunks:                                       # (3, n) arrays, in order
+        result = tracker.update(chunk)
+        update_plot(result['timestamp'], result['thd'])
+    
+    # Several tests and quantities at once on every core (arrays shared, not pickled)
+    waveforms = {
+        '9B current': {'samples': currents_9b, 'sample_rate': fs, 'start': t0_9b, 'phases': ['A', 'B', 'C']},
+        '9C current': {'samples': currents_9c, 'sample_rate': fs, 'start': t0_9c, 'phases': ['A', 'B', 'C']},
+    }
+    table = compute_harmonics_table(waveforms, workers=os.cpu_count())
+    
+    # Persist the (time, channel, harmonic) cube once, then query slices instead of re-running FFTs
+    cube = SpectralCube.build(samples, sample_rate, df.index[0], channels=['IA', 'IB', 'IC'])
+    cube.query(RUN_START, RUN_END, channels=['IA'], orders=[1, 5, 7])    # long-format DataFrame
+    cube.thd(RUN_START, RUN_END)                               # (time, channel) THD percent
+    
+    # IEC 61000-4-7 mode: windows synchronized to the measured fundamental, grouped harmonics
+    iec = compute_iec_harmonics(samples, sample_rate)
+    iec['groups'], iec['subgroups']                            # (windows, phases, 50)
+    times = sample_offsets_to_times(df.index[0], sample_rate, iec['start_samples'])
+
+SPECTRUM CONVENTIONS:
+    Harmonic h is read from the FFT bin nearest h * fundamental. Magnitudes are
+    peak amplitudes (2|X[k]| / N for a rectangular window, corrected for the
+    coherent gain of other window functions). Windows should span an integer
+    number of fundamental cycles (12 cycles = 200 ms at 60 Hz by default) so
+    every harmonic falls on a bin.
+
+METHODS:
+    method='fft' (default) runs a full rfft per window and keeps the harmonic
+    bins. method='dft' evaluates only the requested bins: each block of
+    windows is multiplied by a cached (window_samples, 2 * harmonics) real
+    matrix of cosine and sine twiddles (window function folded in), one GEMM
+    per block. For short windows, many channels or a small harmonic set this
+    beats the full FFT and never materializes the unused bins.
+
+IEC 61000-4-7 MODE:
+    Fixed-length windows leak energy between bins when the source drifts off
+    60 Hz (e.g. the Moxion MP75 in test 9B). compute_iec_harmonics instead
+    tracks the fundamental from rising zero crossings of a low-passed
+    reference phase (zero_crossings), cuts contiguous windows of exactly
+    12 measured cycles (10 for 50 Hz systems), resamples every window to a
+    whole number of samples per cycle with a vectorized windowed-sinc gather
+    (bandlimited_resample; linear interpolation is a low-pass that reads
+    high orders several percent low), and groups the FFT bins into harmonic
+    groups and subgroups:
+        group(n)^2    = C(nN - N/2)^2 / 2 + sum C(nN + i)^2 (|i| < N/2) + C(nN + N/2)^2 / 2
+        subgroup(n)^2 = C(nN - 1)^2 + C(nN)^2 + C(nN + 1)^2
+    where N is the number of cycles per window and C(k) the bin magnitudes.
+
+PARALLEL EXECUTION:
+    compute_spectra_parallel copies each waveform once into a
+    multiprocessing.shared_memory block and splits the work into tasks of
+    one phase x one block of windows. Worker processes (started with 'fork')
+    attach to the blocks, run compute_harmonic_spectrum on their slice and
+    write the magnitudes straight into a shared output array at their window
+    offset, so no waveform or result array is pickled. Each worker runs its
+    FFTs on one thread and caps BLAS at one thread (limit_blas_threads, with
+    threadpoolctl if installed), so N workers use N cores rather than N^2
+    threads. Where fork is unavailable (Windows), or this module was loaded
+    by path without being registered in sys.modules (see PARALLEL PARSING in
+    utils-exports), the spectra are computed in one process instead.
+
+STREAMING:
+    SlidingHarmonicTracker keeps the selected harmonic bins of the last
+    window_samples samples with a damped sliding DFT,
+        S_k(n) = r e^(j 2 pi k / N) (S_k(n - 1) + x(n) - r^N x(n - N)),
+    an O(H) update per sample run through scipy.signal.lfilter per bin.
+    The damping r < 1 (STREAMING_DAMPING) keeps rounding errors from
+    accumulating on the unit circle; its bias on magnitudes is about
+    (1 - r) * N / 2 (under 0.1% for a 12-cycle window). THD is emitted every
+    `decimation` samples once the first window is full. Chunks must be
+    contiguous (use overlap_samples=0 with iter_pmu_signal_chunks).
+
+SPECTRAL CUBES:
+    SpectralCube stores the magnitude and phase of harmonics 1..max_harmonic
+    for every window and channel of a waveform set as float32 .npy arrays of
+    shape (time, channel, harmonic), plus int64 UTC window start times, in
+    '<cache_dir>/<key>/' (default <repo>/data/temp/spectral_cubes, so
+    notebooks in any directory share one store). The key hashes the waveform
+    samples (BLAKE2b over the float32 bytes), sample rate, start time,
+    channel names and every window parameter, so a changed waveform, name or
+    setting gets a new cube. meta.json is written last, so a partially
+    written cube is never used. Cubes are opened memory-mapped; query/thd/slice read only the
+    requested time range, channels and harmonic orders.
+
+MEMORY:
+    Windows are views into the sample array; only the FFT input and output of
+    one block of windows (block_windows) is materialized at a time.
+
+ERROR HANDLING:
+    - HarmonicsError: Custom exception for invalid harmonics parameters
+
+Author: Generated for Green Construction Task 5
+Date: February 2026
+"""
+
+import os
+import sys
+import json
+import hashlib
+import functools
+import contextlib
+import importlib.util
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+import scipy.fft
+from numpy.lib.stride_tricks import sliding_window_view
+from datetime import datetime
+from typing import Dict, Optional, Sequence, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _load_util(name: str):
+    """Load a sibling utils module by file path (the file names are hyphenated)."""
+    module_name = name.replace('-', '_')
+    if module_name not in sys.modules:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), f'{name}.py')
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[module_name]
+
+
+# Shared-memory, time zone and epoch helpers live in utils-exports
+exports = _load_util('utils-exports')
+
+# Nominal grid frequency (Hz) and default analysis settings
+NOMINAL_FREQUENCY = 60.0
+DEFAULT_WINDOW_CYCLES = 12
+DEFAULT_MAX_HARMONIC = 50
+IEEE519_THD_LIMIT_PERCENT = 5.0
+
+# Spectrum methods accepted by compute_harmonic_spectrum
+SPECTRUM_METHODS = ('fft', 'dft')
+
+# Twiddle matrices kept by twiddle_matrix (one per window length, bins and window function)
+TWIDDLE_CACHE_SIZE = 32
+
+# Reference low-pass cutoff for zero-crossing detection, in multiples of the nominal frequency
+ZERO_CROSSING_CUTOFF = 1.5
+
+# Kaiser-windowed sinc used to resample IEC windows: taps on each side and window beta
+RESAMPLE_HALF_TAPS = 16
+RESAMPLE_KAISER_BETA = 8.0
+
+# Sliding-DFT damping factor (pole radius) of SlidingHarmonicTracker
+STREAMING_DAMPING = 1.0 - 1e-6
+
+# Spectral cube store under the repository's data/temp, wherever the caller runs from
+# (bump the version when the cube layout changes)
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SPECTRAL_CUBE_DIR = os.path.join(REPO_ROOT, 'data', 'temp', 'spectral_cubes')
+SPECTRAL_CUBE_VERSION = 1
+
+# Windows per task of compute_spectra_parallel
+DEFAULT_TASK_WINDOWS = 4096
+
+# Windows transformed per batched FFT call (bounds peak memory of a long capture)
+DEFAULT_BLOCK_WINDOWS = 2048
+
+
+class HarmonicsError(Exception):
+    """Custom exception for harmonics analysis errors"""
+    pass
+
+
+def as_phase_array(samples: np.ndarray) -> np.ndarray:
+    """
+    View samples as a 2D (phases, samples) array.
+    
+    Args:
+        samples (np.ndarray): 1D samples of one phase, or 2D (phases, samples)
+    
+    Returns:
+        np.ndarray: 2D array (a view when possible)
+    
+    Raises:
+        HarmonicsError: If samples has more than two dimensions
+    """
+    samples = np.asarray(samples)
+    if samples.ndim == 1:
+        return samples[np.newaxis, :]
+    if samples.ndim != 2:
+        raise HarmonicsError(f"Expected samples of shape (samples,) or (phases, samples), got {samples.shape}")
+    return samples
+
+
+def window_length(sample_rate: float, fundamental: float = NOMINAL_FREQUENCY,
+                  cycles: int = DEFAULT_WINDOW_CYCLES) -> int:
+    """
+    Number of samples in a window of whole fundamental cycles.
+    
+    Args:
+        sample_rate (float): Sampling rate (Hz)
+        fundamental (float): Fundamental frequency (Hz, default: 60)
+        cycles (int): Fundamental cycles per window (default: 12)
+    
+    Returns:
+        int: Window length in samples
+    """
+    return int(round(cycles * sample_rate / fundamental))
+
+
+def sliding_windows(samples: np.ndarray, window_samples: int, hop_samples: Optional[int] = None) -> np.ndarray:
+    """
+    All analysis windows of a capture as a strided view (no copy).
+    
+    Args:
+        samples (np.ndarray): 1D or 2D (phases, samples) array
+        window_samples (int): Samples per window
+        hop_samples (int, optional): Samples between window starts (default: window_samples)
+    
+    Returns:
+        np.ndarray: Read-only view of shape (windows, phases, window_samples)
+    
+    Raises:
+        HarmonicsError: If the window or hop is not positive or longer than the capture
+    """
+    samples = as_phase_array(samples)
+    hop_samples = hop_samples or window_samples
+    if window_samples <= 0 or hop_samples <= 0:
+        raise HarmonicsError(f"Window ({window_samples}) and hop ({hop_samples}) must be positive")
+    if samples.shape[1] < window_samples:
+        raise HarmonicsError(f"Capture of {samples.shape[1]} samples is shorter than one window ({window_samples})")
+    windows = sliding_window_view(samples, window_samples, axis=-1)[:, ::hop_samples, :]
+    return windows.transpose(1, 0, 2)
+
+
+def harmonic_bins(window_samples: int, sample_rate: float, fundamental: float = NOMINAL_FREQUENCY,
+                  max_harmonic: int = DEFAULT_MAX_HARMONIC, orders: Optional[Sequence[int]] = None) -> np.ndarray:
+    """
+    FFT bin index of each harmonic order in a window.
+    
+    Args:
+        window_samples (int): Samples per window
+        sample_rate (float): Sampling rate (Hz)
+        fundamental (float): Fundamental frequency (Hz, default: 60)
+        max_harmonic (int): Highest harmonic order, used when orders is None (default: 50)
+        orders (Sequence[int], optional): Harmonic orders (default: 1..max_harmonic)
+    
+    Returns:
+        np.ndarray: int64 bin indices, one per harmonic order
+    
+    Raises:
+        HarmonicsError: If a harmonic lies above the Nyquist frequency
+    """
+    orders = np.arange(1, max_harmonic + 1) if orders is None else np.asarray(orders)
+    if orders.max() * fundamental >= sample_rate / 2:
+        raise HarmonicsError(f"Harmonic {orders.max()} ({orders.max() * fundamental:.0f} Hz) is above "
+                             f"the Nyquist frequency of {sample_rate / 2:.0f} Hz")
+    return np.rint(orders * fundamental * window_samples / sample_rate).astype(np.int64)
+
+
+def analysis_window(window_samples: int, window_function: Optional[str] = None) -> Optional[np.ndarray]:
+    """
+    Window function scaled to unit coherent gain, or None for rectangular.
+    
+    Args:
+        window_samples (int): Samples per window
+        window_function (str, optional): Any scipy.signal.get_window name (e.g. 'hann')
+    
+    Returns:
+        np.ndarray or None: Weights whose mean is 1
+    """
+    if window_function in (None, 'rect', 'rectangular', 'boxcar'):
+        return None
+    from scipy.signal import get_window
+    weights = get_window(window_function, window_samples, fftbins=True)
+    return weights / weights.mean()
+
+
+@functools.lru_cache(maxsize=TWIDDLE_CACHE_SIZE)
+def twiddle_matrix(window_samples: int, bins: tuple, window_function: Optional[str] = None) -> np.ndarray:
+    """
+    Real DFT matrix evaluating only the given bins, cached per window length, bins and window.
+    
+    Column j holds w[n] * cos(2 pi k_j n / N) and column H + j holds
+    -w[n] * sin(2 pi k_j n / N), so x @ M gives the real and imaginary parts
+    of the selected DFT bins of x (w is the window function, 1 for rectangular).
+    
+    Args:
+        window_samples (int): Samples per window (N)
+        bins (tuple): Bin indices k_j (a tuple so the call can be cached)
+        window_function (str, optional): Window function name (default: rectangular)
+    
+    Returns:
+        np.ndarray: Read-only float32 matrix of shape (window_samples, 2 * len(bins))
+    """
+    n = np.arange(window_samples, dtype=np.float64)[:, np.newaxis]
+    phase = 2.0 * np.pi * np.mod(n * np.asarray(bins, dtype=np.float64), window_samples) / window_samples
+    matrix = np.hstack([np.cos(phase), -np.sin(phase)])
+    weights = analysis_window(window_samples, window_function)
+    if weights is not None:
+        matrix *= weights[:, np.newaxis]
+    matrix = matrix.astype(np.float32)
+    matrix.flags.writeable = False
+    return matrix
+
+
+def compute_harmonic_spectrum(samples: np.ndarray, sample_rate: float,
+                              window_samples: Optional[int] = None, hop_samples: Optional[int] = None,
+                              fundamental: float = NOMINAL_FREQUENCY, max_harmonic: int = DEFAULT_MAX_HARMONIC,
+                              window_function: Optional[str] = None,
+                              block_windows: int = DEFAULT_BLOCK_WINDOWS, method: str = 'fft',
+                              orders: Optional[Sequence[int]] = None,
+                              return_phase: bool = False, fft_workers: int = -1) -> Union[np.ndarray, tuple]:
+    """
+    Harmonic magnitudes of every window of a capture, with batched transforms.
+    
+    Windows are a strided view of the samples. With method='fft' each block of
+    block_windows windows (all phases) goes through one scipy.fft.rfft call
+    along the last axis (on fft_workers threads, every core by default), and
+    only the harmonic bins are kept.
+    With method='dft' each block is multiplied by the cached twiddle_matrix of
+    the harmonic bins instead, so only those bins are computed.
+    
+    Args:
+        samples (np.ndarray): 1D samples or 2D (phases, samples)
+        sample_rate (float): Sampling rate (Hz)
+        window_samples (int, optional): Samples per window (default: 12 fundamental cycles)
+        hop_samples (int, optional): Samples between window starts (default: window_samples)
+        fundamental (float): Fundamental frequency (Hz, default: 60)
+        max_harmonic (int): Highest harmonic order (default: 50)
+        window_function (str, optional): Window function name (default: rectangular)
+        block_windows (int): Windows per batched transform (default: 2048)
+        method (str): 'fft' (full rfft) or 'dft' (targeted bins only) (default: 'fft')
+        orders (Sequence[int], optional): Harmonic orders to compute (default: 1..max_harmonic)
+        return_phase (bool): Also return the phase of each harmonic (default: False)
+        fft_workers (int): Threads per rfft call, -1 for every core (default: -1)
+    
+    Returns:
+        np.ndarray: float32 peak magnitudes of shape (windows, phases, harmonics); with
+            the default orders, index h - 1 holds harmonic h. With return_phase, a tuple
+            (magnitudes, phases) where phases are float32 radians relative to the window start
+    
+    Raises:
+        HarmonicsError: If the parameters do not fit the capture or method is unknown
+    """
+    if method not in SPECTRUM_METHODS:
+        raise HarmonicsError(f"Unknown spectrum method '{method}'. Supported methods: {SPECTRUM_METHODS}")
+    window_samples = window_samples or window_length(sample_rate, fundamental)
+    windows = sliding_windows(samples, window_samples, hop_samples)
+    bins = harmonic_bins(window_samples, sample_rate, fundamental, max_harmonic, orders)
+    if method == 'dft':
+        matrix = twiddle_matrix(window_samples, tuple(bins.tolist()), window_function)
+    else:
+        weights = analysis_window(window_samples, window_function)
+    
+    num_windows, num_phases = windows.shape[:2]
+    num_bins = len(bins)
+    magnitudes = np.empty((num_windows, num_phases, num_bins), dtype=np.float32)
+    phases = np.empty((num_windows, num_phases, num_bins), dtype=np.float32) if return_phase else None
+    scale = 2.0 / window_samples
+    for first in range(0, num_windows, block_windows):
+        block = windows[first:first + block_windows]
+        rows = slice(first, first + len(block))
+        if method == 'dft':
+            parts = block.astype(np.float32, copy=False) @ matrix
+            real, imag = parts[..., :num_bins], parts[..., num_bins:]
+            magnitudes[rows] = np.hypot(real, imag) * scale
+            if return_phase:
+                phases[rows] = np.arctan2(imag, real)
+        else:
+            if weights is not None:
+                block = block * weights
+            spectrum = scipy.fft.rfft(block, axis=-1, workers=fft_workers)[..., bins]
+            magnitudes[rows] = np.abs(spectrum) * scale
+            if return_phase:
+                phases[rows] = np.angle(spectrum)
+    
+    logger.info(f"Computed {num_bins} harmonics ({method}) for {num_windows} windows x {num_phases} phases "
+                f"({window_samples} samples per window)")
+    return (magnitudes, phases) if return_phase else magnitudes
+
+
+def thd_from_harmonics(magnitudes: np.ndarray) -> np.ndarray:
+    """
+    Total harmonic distortion (percent) from harmonic magnitudes.
+    
+    Args:
+        magnitudes (np.ndarray): Magnitudes with harmonic order 1, 2, ... along the last axis
+    
+    Returns:
+        np.ndarray: float32 THD in percent, shape magnitudes.shape[:-1] (NaN where h1 is 0)
+    """
+    magnitudes = np.asarray(magnitudes, dtype=np.float32)
+    fundamental = magnitudes[..., 0]
+    distortion = np.sqrt(np.sum(np.square(magnitudes[..., 1:], dtype=np.float64), axis=-1))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        thd = np.where(fundamental > 0, 100.0 * distortion / fundamental, np.nan)
+    return thd.astype(np.float32)
+
+
+def zero_crossings(reference: np.ndarray, sample_rate: float,
+                   nominal_frequency: float = NOMINAL_FREQUENCY) -> np.ndarray:
+    """
+    Fractional sample positions of the rising zero crossings of the fundamental.
+    
+    The reference is low-passed (zero phase) just above the nominal frequency
+    so harmonics and noise do not add spurious crossings; each crossing is then
+    located by linear interpolation between the two samples around it.
+    
+    Args:
+        reference (np.ndarray): 1D samples of the reference phase
+        sample_rate (float): Sampling rate (Hz)
+        nominal_frequency (float): Nominal fundamental frequency (Hz, default: 60)
+    
+    Returns:
+        np.ndarray: float64 positions, in samples from the start of reference
+    """
+    from scipy.signal import butter, sosfiltfilt
+    reference = np.asarray(reference, dtype=np.float64)
+    sos = butter(2, ZERO_CROSSING_CUTOFF * nominal_frequency, fs=sample_rate, output='sos')
+    filtered = sosfiltfilt(sos, reference - reference.mean())
+    rising = np.flatnonzero((filtered[:-1] < 0) & (filtered[1:] >= 0))
+    before, after = filtered[rising], filtered[rising + 1]
+    return rising + before / (before - after)
+
+
+def iec_group_weights(cycles: int, max_harmonic: int) -> tuple:
+    """
+    Bin-power weight matrices of IEC 61000-4-7 harmonic groups and subgroups.
+    
+    Args:
+        cycles (int): Fundamental cycles per window (N)
+        max_harmonic (int): Highest harmonic order
+    
+    Returns:
+        tuple: (group_weights, subgroup_weights), each float64 (bins, max_harmonic)
+            with bins = max_harmonic * N + N // 2 + 1
+    """
+    num_bins = max_harmonic * cycles + cycles // 2 + 1
+    half = cycles // 2
+    group_weights = np.zeros((num_bins, max_harmonic))
+    subgroup_weights = np.zeros((num_bins, max_harmonic))
+    for column, order in enumerate(range(1, max_harmonic + 1)):
+        center = order * cycles
+        group_weights[center - half:center + half + 1, column] = 1.0
+        if cycles % 2 == 0:
+            group_weights[[center - half, center + half], column] = 0.5
+        subgroup_weights[center - 1:center + 2, column] = 1.0
+    return group_weights, subgroup_weights
+
+
+def bandlimited_resample(samples: np.ndarray, positions: np.ndarray,
+                         half_taps: int = RESAMPLE_HALF_TAPS,
+                         beta: float = RESAMPLE_KAISER_BETA) -> np.ndarray:
+    """
+    Band-limited (windowed-sinc) values of sampled signals at fractional positions.
+    
+    Each output is the sum of the 2 * half_taps nearest samples weighted by
+    a Kaiser-windowed sinc, gathered for all positions at once (one pass per
+    tap). With the defaults the response is flat to about 0.01% up to 0.75 of
+    the Nyquist frequency, where linear interpolation loses several percent.
+    Positions within half_taps of either end reuse the edge sample.
+    
+    Args:
+        samples (np.ndarray): 2D (phases, samples)
+        positions (np.ndarray): Fractional sample positions, any shape
+        half_taps (int): Kernel taps on each side of a position (default: 16)
+        beta (float): Kaiser window beta (default: 8.0)
+    
+    Returns:
+        np.ndarray: float64 (phases, *positions.shape) resampled values
+    """
+    base = np.floor(positions).astype(np.int64)
+    fraction = positions - base
+    last_sample = samples.shape[1] - 1
+    resampled = np.zeros((samples.shape[0],) + positions.shape)
+    for tap in range(1 - half_taps, half_taps + 1):
+        distance = tap - fraction
+        taper = np.sqrt(np.clip(1.0 - np.square(distance / half_taps), 0.0, None))
+        weight = np.sinc(distance) * np.i0(beta * taper) / np.i0(beta)
+        resampled += samples[:, np.clip(base + tap, 0, last_sample)] * weight
+    return resampled
+
+
+def compute_iec_harmonics(samples: np.ndarray, sample_rate: float, reference: int = 0,
+                          cycles: int = DEFAULT_WINDOW_CYCLES, max_harmonic: int = DEFAULT_MAX_HARMONIC,
+                          samples_per_cycle: Optional[int] = None,
+                          nominal_frequency: float = NOMINAL_FREQUENCY,
+                          block_windows: int = DEFAULT_BLOCK_WINDOWS) -> dict:
+    """
+    IEC 61000-4-7 grouped harmonics from windows synchronized to the fundamental.
+    
+    Window boundaries are every cycles-th rising zero crossing of the reference
+    phase, so each window spans exactly `cycles` measured periods. Each window
+    is resampled to cycles * samples_per_cycle points with a windowed sinc
+    (bandlimited_resample, all windows of a block at once), transformed with
+    one batched rfft, and its bins grouped around each harmonic with the IEC
+    weights. A pure 0.05 pu tone at h40 or h49 sampled at 7812.5 Hz reads
+    within 0.1% of its amplitude.
+    
+    Args:
+        samples (np.ndarray): 1D samples or 2D (phases, samples)
+        sample_rate (float): Sampling rate (Hz)
+        reference (int): Phase row used to track the fundamental (default: 0)
+        cycles (int): Cycles per window: 12 for 60 Hz, 10 for 50 Hz systems (default: 12)
+        max_harmonic (int): Highest harmonic order (default: 50)
+        samples_per_cycle (int, optional): Resampled points per cycle (default: the power
+            of two at or above sample_rate / nominal_frequency, at least 2 * max_harmonic + 2)
+        nominal_frequency (float): Nominal fundamental frequency (Hz, default: 60)
+        block_windows (int): Windows per batched FFT call (default: 2048)
+    
+    Returns:
+        dict: {
+            'groups': float32 (windows, phases, max_harmonic) harmonic group magnitudes,
+            'subgroups': float32 (windows, phases, max_harmonic) harmonic subgroup magnitudes,
+            'frequency': float32 (windows,) measured fundamental of each window (Hz),
+            'start_samples': float64 (windows,) fractional sample position of each window start,
+        }
+    
+    Raises:
+        HarmonicsError: If the capture holds less than one synchronized window
+    """
+    samples = as_phase_array(samples)
+    if samples_per_cycle is None:
+        samples_per_cycle = 1 << int(np.ceil(np.log2(sample_rate / nominal_frequency)))
+    samples_per_cycle = max(samples_per_cycle, 2 * max_harmonic + 2)
+    
+    crossings = zero_crossings(samples[reference], sample_rate, nominal_frequency)
+    boundaries = crossings[::cycles]
+    if len(boundaries) < 2:
+        raise HarmonicsError(f"Capture holds less than one {cycles}-cycle window")
+    starts, ends = boundaries[:-1], boundaries[1:]
+    num_windows, num_phases = len(starts), samples.shape[0]
+    
+    points = cycles * samples_per_cycle
+    fraction = np.arange(points) / points
+    group_weights, subgroup_weights = iec_group_weights(cycles, max_harmonic)
+    num_bins = group_weights.shape[0]
+    scale = 2.0 / points
+    
+    groups = np.empty((num_windows, num_phases, max_harmonic), dtype=np.float32)
+    subgroups = np.empty((num_windows, num_phases, max_harmonic), dtype=np.float32)
+    for first in range(0, num_windows, block_windows):
+        block = slice(first, first + block_windows)
+        positions = starts[block, np.newaxis] + (ends[block] - starts[block])[:, np.newaxis] * fraction
+        # (phases, windows, points) -> (windows, phases, points)
+        resampled = bandlimited_resample(samples, positions).transpose(1, 0, 2)
+        power = np.square(np.abs(scipy.fft.rfft(resampled, axis=-1, workers=-1)[..., :num_bins]) * scale)
+        groups[block] = np.sqrt(power @ group_weights)
+        subgroups[block] = np.sqrt(power @ subgroup_weights)
+    
+    frequency = (cycles * sample_rate / (ends - starts)).astype(np.float32)
+    logger.info(f"IEC 61000-4-7 harmonics: {num_windows} windows of {cycles} cycles, "
+                f"fundamental {np.nanmin(frequency):.3f} to {np.nanmax(frequency):.3f} Hz")
+    return {
+        'groups': groups,
+        'subgroups': subgroups,
+        'frequency': frequency,
+        'start_samples': starts,
+    }
+
+
+def limit_blas_threads(threads: int = 1):
+    """
+    Context manager capping the BLAS threads (numpy matmul) of this process.
+    
+    Uses threadpoolctl when it is installed; without it BLAS keeps its
+    default thread count (set OPENBLAS_NUM_THREADS / MKL_NUM_THREADS before
+    starting Python to cap it instead).
+    
+    Args:
+        threads (int): Maximum BLAS threads (default: 1)
+    
+    Returns:
+        A context manager
+    """
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        logger.debug("threadpoolctl is not installed; BLAS threads are not limited")
+        return contextlib.nullcontext()
+    return threadpool_limits(limits=threads, user_api='blas')
+
+
+def _spectrum_task_into_shared(samples_shm: str, samples_shape: tuple, output_shm: str, output_shape: tuple,
+                               phase: int, first_window: int, stop_window: int, window_samples: int,
+                               hop_samples: int, sample_rate: float, spectrum_kwargs: dict) -> int:
+    """Compute the spectra of one phase and block of windows into the shared output (worker)."""
+    samples_block = exports.attach_shared_memory(samples_shm)
+    output_block = exports.attach_shared_memory(output_shm)
+    try:
+        samples = np.ndarray(samples_shape, dtype=np.float32, buffer=samples_block.buf)
+        output = np.ndarray(output_shape, dtype=np.float32, buffer=output_block.buf)
+        first_sample = first_window * hop_samples
+        stop_sample = (stop_window - 1) * hop_samples + window_samples
+        # One thread per worker: the pool already runs a task per core
+        with limit_blas_threads(1):
+            output[first_window:stop_window, phase] = compute_harmonic_spectrum(
+                samples[phase, first_sample:stop_sample], sample_rate, window_samples, hop_samples,
+                **spectrum_kwargs, fft_workers=1)[:, 0]
+        del samples, output
+    finally:
+        samples_block.close()
+        output_block.close()
+    return stop_window - first_window
+
+
+def compute_spectra_parallel(waveforms: Dict[str, dict], workers: Optional[int] = None,
+                             window_samples: Optional[int] = None, hop_samples: Optional[int] = None,
+                             fundamental: float = NOMINAL_FREQUENCY,
+                             task_windows: int = DEFAULT_TASK_WINDOWS, **spectrum_kwargs) -> Dict[str, np.ndarray]:
+    """
+    Harmonic spectra of several waveform sets on a process pool over shared memory.
+    
+    Each set is copied once (as float32) into shared memory; tasks of one
+    phase x task_windows windows are fanned out to the workers, which write
+    their magnitudes into a shared (windows, phases, harmonics) output.
+    
+    Args:
+        waveforms (dict): {name: {'samples': (phases, samples) array, 'sample_rate': Hz, ...}}
+        workers (int, optional): Worker processes (default: os.cpu_count())
+        window_samples (int, optional): Samples per window (default: 12 fundamental cycles of each set)
+        hop_samples (int, optional): Samples between window starts (default: window_samples)
+        fundamental (float): Fundamental frequency (Hz, default: 60)
+        task_windows (int): Windows per task (default: 4096)
+        **spectrum_kwargs: Passed to compute_harmonic_spectrum (max_harmonic, method, orders, ...;
+            fft_workers applies only when computing in one process)
+    
+    Returns:
+        dict: {name: float32 (windows, phases, harmonics) magnitudes}
+    
+    Raises:
+        HarmonicsError: If a waveform set is invalid
+    """
+    workers = workers or os.cpu_count() or 1
+    spectrum_kwargs['fundamental'] = fundamental
+    worker_kwargs = {name: value for name, value in spectrum_kwargs.items() if name != 'fft_workers'}
+    serial = workers <= 1 or 'fork' not in multiprocessing.get_all_start_methods()
+    if workers > 1 and serial:
+        logger.warning("Parallel harmonics need the 'fork' start method; computing in one process")
+    elif not serial and not exports.importable_by_workers(_spectrum_task_into_shared):
+        logger.warning(f"Module {__name__} is not registered in sys.modules, so workers cannot import it; "
+                       f"computing in one process")
+        serial = True
+    if serial:
+        return {name: compute_harmonic_spectrum(waveform['samples'], waveform['sample_rate'],
+                                                window_samples, hop_samples, **spectrum_kwargs)
+                for name, waveform in waveforms.items()}
+    
+    blocks = []
+    jobs = []
+    results = {}
+    try:
+        for name, waveform in waveforms.items():
+            samples = as_phase_array(waveform['samples'])
+            sample_rate = waveform['sample_rate']
+            window = window_samples or window_length(sample_rate, fundamental)
+            hop = hop_samples or window
+            num_windows = sliding_windows(samples, window, hop).shape[0]
+            num_harmonics = len(harmonic_bins(window, sample_rate, fundamental,
+                                              spectrum_kwargs.get('max_harmonic', DEFAULT_MAX_HARMONIC),
+                                              spectrum_kwargs.get('orders')))
+            output_shape = (num_windows, samples.shape[0], num_harmonics)
+            
+            samples_block = shared_memory.SharedMemory(create=True, size=max(samples.size * 4, 1))
+            blocks.append(samples_block)
+            output_block = shared_memory.SharedMemory(create=True, size=max(int(np.prod(output_shape)) * 4, 1))
+            blocks.append(output_block)
+            np.ndarray(samples.shape, dtype=np.float32, buffer=samples_block.buf)[:] = samples
+            results[name] = (output_block, output_shape)
+            
+            for phase in range(samples.shape[0]):
+                for first in range(0, num_windows, task_windows):
+                    jobs.append((samples_block.name, samples.shape, output_block.name, output_shape, phase,
+                                 first, min(first + task_windows, num_windows), window, hop, sample_rate))
+        
+        logger.info(f"Computing harmonics for {len(waveforms)} waveform set(s) as {len(jobs)} tasks "
+                    f"on {workers} processes")
+        exports.start_resource_tracker()
+        context = multiprocessing.get_context('fork')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            futures = [executor.submit(_spectrum_task_into_shared, *job, worker_kwargs) for job in jobs]
+            for future in futures:
+                future.result()
+        
+        # Copy out so the shared blocks can be released
+        return {name: np.ndarray(shape, dtype=np.float32, buffer=block.buf).copy()
+                for name, (block, shape) in results.items()}
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def compute_harmonics_table(waveforms: Dict[str, dict], workers: Optional[int] = None,
+                            window_samples: Optional[int] = None, hop_samples: Optional[int] = None,
+                            fundamental: float = NOMINAL_FREQUENCY, **spectrum_kwargs) -> pd.DataFrame:
+    """
+    Per-window harmonics and THD of several waveform sets, gathered into one table.
+    
+    Args:
+        waveforms (dict): {name: {'samples': (phases, samples) array, 'sample_rate': Hz,
+            'start': time of the first sample, 'phases': phase names (optional)}}
+        workers (int, optional): Worker processes (default: os.cpu_count())
+        window_samples (int, optional): Samples per window (default: 12 fundamental cycles of each set)
+        hop_samples (int, optional): Samples between window starts (default: window_samples)
+        fundamental (float): Fundamental frequency (Hz, default: 60)
+        **spectrum_kwargs: Passed to compute_spectra_parallel
+    
+    Returns:
+        pd.DataFrame: harmonics_to_dataframe rows of every set, with a leading 'source'
+            column holding the set name
+    """
+    spectra = compute_spectra_parallel(waveforms, workers, window_samples, hop_samples, fundamental,
+                                       **spectrum_kwargs)
+    frames = []
+    for name, magnitudes in spectra.items():
+        waveform = waveforms[name]
+        window = window_samples or window_length(waveform['sample_rate'], fundamental)
+        times = window_times(waveform['start'], waveform['sample_rate'], len(magnitudes), window, hop_samples)
+        phases = waveform.get('phases') or [f'Phase {i + 1}' for i in range(magnitudes.shape[1])]
+        df = harmonics_to_dataframe(magnitudes, times, phases, spectrum_kwargs.get('orders'))
+        df.insert(0, 'source', name)
+        frames.append(df)
+    return pd.concat(frames) if frames else pd.DataFrame()
+
+
+def sample_offsets_to_times(start: Union[pd.Timestamp, np.datetime64], sample_rate: float,
+                            offsets: np.ndarray) -> pd.DatetimeIndex:
+    """
+    Timestamps of (possibly fractional) sample offsets from the first sample.
+    
+    Args:
+        start (pd.Timestamp or np.datetime64): Time of the first sample
+        sample_rate (float): Sampling rate (Hz)
+        offsets (np.ndarray): Offsets in samples
+    
+    Returns:
+        pd.DatetimeIndex: One timestamp per offset, named 'timestamp' (keeps start's time zone)
+    """
+    offsets_ns = np.rint(np.asarray(offsets, dtype=np.float64) * (1e9 / sample_rate)).astype(np.int64)
+    return pd.DatetimeIndex(pd.Timestamp(start) + pd.to_timedelta(offsets_ns, unit='ns'), name='timestamp')
+
+
+def window_times(start: Union[pd.Timestamp, np.datetime64], sample_rate: float, num_windows: int,
+                 window_samples: int, hop_samples: Optional[int] = None, align: str = 'start') -> pd.DatetimeIndex:
+    """
+    Timestamps of the analysis windows of a uniformly sampled capture.
+    
+    Args:
+        start (pd.Timestamp or np.datetime64): Time of the first sample
+        sample_rate (float): Sampling rate (Hz)
+        num_windows (int): Number of windows
+        window_samples (int): Samples per window
+        hop_samples (int, optional): Samples between window starts (default: window_samples)
+        align (str): 'start' or 'center' of each window (default: 'start')
+    
+    Returns:
+        pd.DatetimeIndex: One timestamp per window, named 'timestamp' (keeps start's time zone)
+    """
+    hop_samples = hop_samples or window_samples
+    offsets = np.arange(num_windows, dtype=np.int64) * hop_samples
+    if align == 'center':
+        offsets = offsets + window_samples // 2
+    return sample_offsets_to_times(start, sample_rate, offsets)
+
+
+def harmonics_to_dataframe(magnitudes: np.ndarray, times: pd.DatetimeIndex,
+                           phases: Sequence[str], orders: Optional[Sequence[int]] = None) -> pd.DataFrame:
+    """
+    Long-format table of per-window harmonics and THD.
+    
+    Matches the layout of the notebooks' time_varying_harmonics_df: one row per
+    window and phase, indexed by 'timestamp', with 'phase', 'thd' and one
+    'h<order>' column per harmonic.
+    
+    Args:
+        magnitudes (np.ndarray): (windows, phases, harmonics) magnitudes
+        times (pd.DatetimeIndex): One timestamp per window
+        phases (Sequence[str]): Phase names, one per phase
+        orders (Sequence[int], optional): Harmonic order of each column (default: 1..harmonics)
+    
+    Returns:
+        pd.DataFrame: The table, ordered by timestamp then phase
+    """
+    num_windows, num_phases, num_harmonics = magnitudes.shape
+    if len(phases) != num_phases or len(times) != num_windows:
+        raise HarmonicsError(f"Got {len(times)} times and {len(phases)} phase names for "
+                             f"{num_windows} windows x {num_phases} phases")
+    orders = list(orders) if orders is not None else list(range(1, num_harmonics + 1))
+    flat = magnitudes.reshape(num_windows * num_phases, num_harmonics)
+    df = pd.DataFrame(flat, columns=[f'h{order}' for order in orders])
+    df.insert(0, 'thd', thd_from_harmonics(magnitudes).reshape(-1))
+    df.insert(0, 'phase', np.tile(np.asarray(phases, dtype=object), num_windows))
+    df.index = pd.DatetimeIndex(np.repeat(times, num_phases), name='timestamp')
+    return df
+
+
+class SlidingHarmonicTracker:
+    """
+    Streaming harmonic magnitudes and THD via a recursive sliding DFT.
+    
+    Feed contiguous chunks of samples with update(); each call returns the
+    harmonic magnitudes and THD at every decimation-th sample of the chunk,
+    each computed over the window_samples samples ending there.
+    
+    Attributes:
+        sample_rate (float): Sampling rate (Hz)
+        window_samples (int): Samples per sliding window (N)
+        orders (np.ndarray): Harmonic orders tracked (includes 1)
+        bins (np.ndarray): DFT bin of each order in the window
+        decimation (int): Samples between emitted results
+        num_channels (int): Channels per chunk row
+        samples_seen (int): Samples consumed so far (per channel)
+        start (np.datetime64 or None): Time of the first sample, if known
+    """
+    
+    def __init__(self, sample_rate: float, window_samples: Optional[int] = None,
+                 fundamental: float = NOMINAL_FREQUENCY, max_harmonic: int = DEFAULT_MAX_HARMONIC,
+                 orders: Optional[Sequence[int]] = None, decimation: Optional[int] = None,
+                 num_channels: int = 1, start: Optional[Union[pd.Timestamp, np.datetime64]] = None,
+                 damping: float = STREAMING_DAMPING):
+        """
+        Args:
+            sample_rate (float): Sampling rate (Hz)
+            window_samples (int, optional): Samples per window (default: 12 fundamental cycles)
+            fundamental (float): Fundamental frequency (Hz, default: 60)
+            max_harmonic (int): Highest harmonic order, used when orders is None (default: 50)
+            orders (Sequence[int], optional): Harmonic orders to track; must include 1
+            decimation (int, optional): Samples between results (default: one fundamental cycle)
+            num_channels (int): Number of channels (rows) per chunk (default: 1)
+            start (pd.Timestamp or np.datetime64, optional): Time of the first sample
+            damping (float): Pole radius r of the recursion (default: 1 - 1e-6)
+        
+        Raises:
+            HarmonicsError: If orders does not include the fundamental
+        """
+        self.sample_rate = sample_rate
+        self.window_samples = window_samples or window_length(sample_rate, fundamental)
+        self.orders = np.arange(1, max_harmonic + 1) if orders is None else np.asarray(orders)
+        if 1 not in self.orders:
+            raise HarmonicsError("orders must include the fundamental (1) to compute THD")
+        self.bins = harmonic_bins(self.window_samples, sample_rate, fundamental, orders=self.orders)
+        self.decimation = decimation or max(1, int(round(sample_rate / fundamental)))
+        self.num_channels = num_channels
+        self.damping = damping
+        self.start = None if start is None else pd.Timestamp(start)
+        self._coefficients = damping * np.exp(2j * np.pi * self.bins / self.window_samples)
+        self._damping_n = damping ** self.window_samples
+        self.reset()
+    
+    def reset(self) -> None:
+        """Forget all samples seen so far (the next chunk starts a new window)."""
+        self.samples_seen = 0
+        self._states = np.zeros((self.num_channels, len(self.bins)), dtype=np.complex128)
+        self._history = np.zeros((self.num_channels, self.window_samples), dtype=np.float64)
+    
+    def update(self, chunk: np.ndarray) -> dict:
+        """
+        Consume the next contiguous chunk of samples.
+        
+        Args:
+            chunk (np.ndarray): 1D samples (one channel) or 2D (num_channels, samples)
+        
+        Returns:
+            dict: {
+                'sample_index': int64 (m,) index of the last sample of each emitted window,
+                'magnitudes': float32 (m, channels, harmonics) peak magnitudes,
+                'thd': float32 (m, channels) THD in percent,
+                'timestamp': DatetimeIndex of the emitted samples (only if start is known),
+            }
+        
+        Raises:
+            HarmonicsError: If the chunk does not have num_channels rows
+        """
+        from scipy.signal import lfilter
+        chunk = as_phase_array(chunk).astype(np.float64, copy=False)
+        if chunk.shape[0] != self.num_channels:
+            raise HarmonicsError(f"Expected {self.num_channels} channel(s), got {chunk.shape[0]}")
+        n = chunk.shape[1]
+        
+        combined = np.concatenate([self._history, chunk], axis=1)
+        driven = chunk - self._damping_n * combined[:, :n]
+        
+        # Samples of this chunk that end a window and fall on the decimation grid
+        absolute = self.samples_seen + np.arange(1, n + 1)
+        emit = np.flatnonzero((absolute % self.decimation == 0) & (absolute >= self.window_samples))
+        
+        spectrum = np.empty((len(emit), self.num_channels, len(self.bins)), dtype=np.complex128)
+        for j, coefficient in enumerate(self._coefficients):
+            initial = (coefficient * self._states[:, j])[:, np.newaxis]
+            output, _ = lfilter([coefficient], [1.0, -coefficient], driven, axis=-1, zi=initial)
+            spectrum[:, :, j] = output[:, emit].T
+            if n:
+                self._states[:, j] = output[:, -1]
+        
+        self._history = combined[:, -self.window_samples:]
+        self.samples_seen += n
+        
+        magnitudes = (np.abs(spectrum) * (2.0 / self.window_samples)).astype(np.float32)
+        fundamental_index = int(np.flatnonzero(self.orders == 1)[0])
+        harmonics = np.delete(magnitudes, fundamental_index, axis=-1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            thd = 100.0 * np.sqrt(np.sum(np.square(harmonics, dtype=np.float64), axis=-1)) / magnitudes[..., fundamental_index]
+        result = {
+            'sample_index': absolute[emit] - 1,
+            'magnitudes': magnitudes,
+            'thd': thd.astype(np.float32),
+        }
+        if self.start is not None:
+            result['timestamp'] = sample_offsets_to_times(self.start, self.sample_rate, result['sample_index'])
+        return result
+
+
+def waveform_content_hash(samples: np.ndarray) -> str:
+    """
+    BLAKE2b digest of a waveform's float32 samples and shape.
+    
+    Args:
+        samples (np.ndarray): 1D or 2D (channels, samples) waveform
+    
+    Returns:
+        str: Hex digest
+    """
+    samples = np.ascontiguousarray(as_phase_array(samples), dtype=np.float32)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(repr(samples.shape).encode('ascii'))
+    digest.update(memoryview(samples).cast('B'))
+    return digest.hexdigest()
+
+
+class SpectralCube:
+    """
+    Persisted (time, channel, harmonic) magnitude and phase cube of one waveform set.
+    
+    Attributes:
+        path (str): Cube directory
+        times_ns (np.ndarray): int64 UTC epoch ns of each window start
+        channels (list): Channel names
+        orders (np.ndarray): Harmonic order of each harmonic index
+        magnitude (np.ndarray): float32 (time, channel, harmonic) peak magnitudes (memory-mapped)
+        phase (np.ndarray): float32 (time, channel, harmonic) phases in radians (memory-mapped)
+        key (dict): Waveform hash, channel names and window parameters the cube was built from
+        tz (str): Time zone of naive query bounds and of returned timestamps
+    """
+    
+    def __init__(self, path: str, tz: str = exports.TIMEZONE_SD):
+        """
+        Open a stored cube (arrays are memory-mapped, not read).
+        
+        Args:
+            path (str): Cube directory
+            tz (str): Time zone of naive query bounds and returned timestamps
+        
+        Raises:
+            HarmonicsError: If the directory does not hold a complete cube
+        """
+        meta_path = os.path.join(path, 'meta.json')
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            self.times_ns = np.load(os.path.join(path, 'times_ns.npy'), mmap_mode='r')
+            self.magnitude = np.load(os.path.join(path, 'magnitude.npy'), mmap_mode='r')
+            self.phase = np.load(os.path.join(path, 'phase.npy'), mmap_mode='r')
+            self.key = meta['key']
+            self.channels = list(meta['channels'])
+            self.orders = np.asarray(meta['orders'])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            raise HarmonicsError(f"No complete spectral cube in {path}: {e!r}")
+        self.path = path
+        self.tz = tz
+    
+    @staticmethod
+    def cube_key(samples: np.ndarray, sample_rate: float, start_ns: int, window_samples: int,
+                 hop_samples: int, fundamental: float, orders: Sequence[int],
+                 window_function: Optional[str], method: str, channels: Sequence[str]) -> dict:
+        """Cache key of a cube: waveform content hash, channel names and every window parameter."""
+        return {
+            'version': SPECTRAL_CUBE_VERSION,
+            'content_blake2b': waveform_content_hash(samples),
+            'sample_rate': float(sample_rate),
+            'start_ns': int(start_ns),
+            'window_samples': int(window_samples),
+            'hop_samples': int(hop_samples),
+            'fundamental': float(fundamental),
+            'orders': [int(order) for order in orders],
+            'window_function': window_function,
+            'method': method,
+            'channels': [str(name) for name in channels],
+        }
+    
+    @classmethod
+    def build(cls, samples: np.ndarray, sample_rate: float,
+              start: Union[datetime, pd.Timestamp, np.datetime64, str],
+              channels: Optional[Sequence[str]] = None, cache_dir: str = SPECTRAL_CUBE_DIR,
+              window_samples: Optional[int] = None, hop_samples: Optional[int] = None,
+              fundamental: float = NOMINAL_FREQUENCY, max_harmonic: int = DEFAULT_MAX_HARMONIC,
+              window_function: Optional[str] = None, method: str = 'fft',
+              tz: str = exports.TIMEZONE_SD, rebuild: bool = False) -> 'SpectralCube':
+        """
+        Open the stored cube for this waveform and window parameters, computing it if needed.
+        
+        Args:
+            samples (np.ndarray): 1D or 2D (channels, samples) waveform
+            sample_rate (float): Sampling rate (Hz)
+            start (datetime, pd.Timestamp, np.datetime64 or str): Time of the first sample
+                (naive times are in tz)
+            channels (Sequence[str], optional): Channel names (default: 'ch0', 'ch1', ...)
+            cache_dir (str): Root directory of the cube store (default: <repo>/data/temp/spectral_cubes)
+            window_samples (int, optional): Samples per window (default: 12 fundamental cycles)
+            hop_samples (int, optional): Samples between window starts (default: window_samples)
+            fundamental (float): Fundamental frequency (Hz, default: 60)
+            max_harmonic (int): Highest harmonic order (default: 50)
+            window_function (str, optional): Window function name (default: rectangular)
+            method (str): 'fft' or 'dft', see compute_harmonic_spectrum (default: 'fft')
+            tz (str): Time zone of naive times (default: America/Los_Angeles)
+            rebuild (bool): Recompute even if a stored cube matches (default: False)
+        
+        Returns:
+            SpectralCube: The stored cube
+        """
+        samples = as_phase_array(samples)
+        channels = list(channels) if channels is not None else [f'ch{i}' for i in range(samples.shape[0])]
+        if len(channels) != samples.shape[0]:
+            raise HarmonicsError(f"Got {len(channels)} channel names for {samples.shape[0]} channels")
+        window_samples = window_samples or window_length(sample_rate, fundamental)
+        hop_samples = hop_samples or window_samples
+        orders = list(range(1, max_harmonic + 1))
+        start_ns = exports.to_epoch_ns(start, tz)
+        key = cls.cube_key(samples, sample_rate, start_ns, window_samples, hop_samples, fundamental,
+                           orders, window_function, method, channels)
+        path = os.path.join(cache_dir, hashlib.sha1(json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()[:20])
+        
+        if not rebuild and os.path.exists(os.path.join(path, 'meta.json')):
+            try:
+                cube = cls(path, tz)
+                if cube.key == key:
+                    logger.info(f"Using stored spectral cube: {path}")
+                    return cube
+            except HarmonicsError as e:
+                logger.warning(f"Ignoring unreadable spectral cube {path}: {e}")
+        
+        magnitude, phase = compute_harmonic_spectrum(
+            samples, sample_rate, window_samples, hop_samples, fundamental, max_harmonic,
+            window_function, method=method, return_phase=True)
+        offsets_ns = np.rint(np.arange(len(magnitude)) * hop_samples * (1e9 / sample_rate)).astype(np.int64)
+        
+        os.makedirs(path, exist_ok=True)
+        meta_path = os.path.join(path, 'meta.json')
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+        np.save(os.path.join(path, 'times_ns.npy'), start_ns + offsets_ns)
+        np.save(os.path.join(path, 'magnitude.npy'), magnitude)
+        np.save(os.path.join(path, 'phase.npy'), phase)
+        tmp_path = meta_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'channels': channels, 'orders': orders}, f, indent=2)
+        os.replace(tmp_path, meta_path)
+        logger.info(f"Stored spectral cube {magnitude.shape} in {path}")
+        return cls(path, tz)
+    
+    def __len__(self) -> int:
+        return len(self.times_ns)
+    
+    def selection(self, start: Optional[Union[datetime, pd.Timestamp, str]] = None,
+                  end: Optional[Union[datetime, pd.Timestamp, str]] = None,
+                  channels: Optional[Sequence[str]] = None,
+                  orders: Optional[Sequence[int]] = None) -> tuple:
+        """
+        Index selection for windows with start <= window start <= end, channels and orders.
+        
+        Args:
+            start, end (datetime, pd.Timestamp or str, optional): Time bounds (naive bounds in tz)
+            channels (Sequence[str], optional): Channel names (default: all)
+            orders (Sequence[int], optional): Harmonic orders (default: all)
+        
+        Returns:
+            tuple: (time slice, channel indices, harmonic indices)
+        
+        Raises:
+            HarmonicsError: If a channel or order is not in the cube
+        """
+        first, stop = 0, len(self.times_ns)
+        if start is not None:
+            first = int(np.searchsorted(self.times_ns, exports.to_epoch_ns(start, self.tz), side='left'))
+        if end is not None:
+            stop = int(np.searchsorted(self.times_ns, exports.to_epoch_ns(end, self.tz), side='right'))
+        
+        if channels is None:
+            channel_index = np.arange(len(self.channels))
+        else:
+            missing = [name for name in channels if name not in self.channels]
+            if missing:
+                raise HarmonicsError(f"Channels {missing} not in cube. Available channels: {self.channels}")
+            channel_index = np.array([self.channels.index(name) for name in channels])
+        
+        if orders is None:
+            order_index = np.arange(len(self.orders))
+        else:
+            positions = {int(order): i for i, order in enumerate(self.orders)}
+            missing = [order for order in orders if int(order) not in positions]
+            if missing:
+                raise HarmonicsError(f"Harmonic orders {missing} not in cube (1..{self.orders.max()})")
+            order_index = np.array([positions[int(order)] for order in orders])
+        return slice(first, max(first, stop)), channel_index, order_index
+    
+    def arrays(self, start=None, end=None, channels=None, orders=None) -> dict:
+        """
+        Selected part of the cube as arrays (see selection for the arguments).
+        
+        Returns:
+            dict: {'times_ns': int64 (time,), 'magnitude': float32 (time, channel, harmonic),
+                'phase': float32 (time, channel, harmonic), 'channels': list, 'orders': np.ndarray}
+        """
+        rows, channel_index, order_index = self.selection(start, end, channels, orders)
+        return {
+            'times_ns': np.asarray(self.times_ns[rows]),
+            'magnitude': self.magnitude[rows][:, channel_index][:, :, order_index],
+            'phase': self.phase[rows][:, channel_index][:, :, order_index],
+            'channels': [self.channels[i] for i in channel_index],
+            'orders': self.orders[order_index],
+        }
+    
+    def thd(self, start=None, end=None, channels=None) -> np.ndarray:
+        """
+        THD percent per window and channel over all stored orders (see selection for the arguments).
+        
+        Returns:
+            np.ndarray: float32 (time, channel) THD in percent
+        """
+        rows, channel_index, _ = self.selection(start, end, channels)
+        return thd_from_harmonics(self.magnitude[rows][:, channel_index])
+    
+    def times(self, start=None, end=None) -> pd.DatetimeIndex:
+        """Window start times between start and end, in tz."""
+        rows, _, _ = self.selection(start, end)
+        return exports.epoch_ns_to_index(self.times_ns[rows], self.tz)
+    
+    def query(self, start=None, end=None, channels=None, orders=None) -> pd.DataFrame:
+        """
+        Long-format table of the selection, like harmonics_to_dataframe.
+        
+        'thd' is computed over all stored orders, whichever orders are selected
+        for the 'h<order>' magnitude columns.
+        
+        Returns:
+            pd.DataFrame: Rows per window and channel, indexed by 'timestamp', with
+                'phase' (channel name), 'thd' and one 'h<order>' column per selected order
+        """
+        selected = self.arrays(start, end, channels, orders)
+        df = harmonics_to_dataframe(selected['magnitude'], self.times(start, end),
+                                    selected['channels'], selected['orders'])
+        df['thd'] = self.thd(start, end, channels).reshape(-1)
+        return df
@@ -12,6 +12,42 @@ USAGE EXAMPLES:
     # Get file info without reading all data (faster)
     info = get_pmu_file_info('path/to/file.signal')
     
+    # Read only a time window (seeks straight to the byte range of the window)
+    df = read_pmu_signal_file('path/to/file.signal',
+                              start=datetime(2026, 2, 13, 14, 31, 12),
+                              end=datetime(2026, 2, 13, 14, 37, 17))
+    
+    # Raw values plus a compact time axis (no per-sample timestamps materialized)
+    values, axis = read_pmu_signal_file('path/to/file.signal', raw=True)
+    
+    # Memory-mapped, zero-copy read (samples are paged in only when touched)
+    df = read_pmu_signal_file('path/to/file.signal', mmap=True)
+    
+    # File info plus chunked summary statistics (cached in a .stats.json sidecar)
+    info = get_pmu_file_info('path/to/file.signal', stats=True)
+    print(info['stats']['zero_count'], info['stats']['percentiles'])
+    
+    # Catalog a directory tree once, then find files covering a time range
+    catalog = SignalCatalog('path/to/pmu_export')
+    paths = catalog.files_between('channel_dir', t0, t1)
+    
+    # Stitch consecutive files into one series and report gaps/overlaps
+    df, discontinuities = read_pmu_signal_files(catalog.files_between('channel_dir', t0, t1))
+    
+    # Read many channels concurrently; failures are reported per file
+    frames, errors = read_pmu_signal_batch({'VA': path_a, 'VB': path_b}, wide=True)
+    
+    # Stream a file larger than RAM in 10-minute blocks with 1024 samples of overlap
+    for t0, block in iter_pmu_signal_chunks('path/to/file.signal', 600, overlap_samples=1024):
+        process(t0, block)
+    
+    # Follow a file that is still being written (yields only newly appended samples)
+    for timestamps, values in follow_pmu_signal_file('path/to/live.signal', idle_timeout=30):
+        update_plot(timestamps, values)
+    
+    # Overview plot data: min/max/mean from the coarsest precomputed level with >= 2000 points
+    overview = query_signal_pyramid('path/to/file.signal', 2000)
+    
     # Safe reading (returns None on error instead of raising exception)
     df = read_pmu_signal_file_safe('path/to/file.signal')
     if df is not None:
@@ -37,28 +73,112 @@ RETURNED DATAFRAME:
     The DataFrame contains two columns:
     - 'timestamp': Pandas datetime index with proper time progression
     - 'value': Signal values as read from the binary file
+    With raw=True, a (values, UniformTimeAxis) tuple is returned instead.
+
+NUMPY-ONLY CORE:
+    pandas is imported lazily, only by functions that build pandas objects
+    (DataFrames, DatetimeIndex). Parsing and validation (parse_signal_filename,
+    validate_signal_file, get_pmu_file_info), reading (read_signal_data,
+    read_pmu_signal_file(raw=True), iter_pmu_signal_chunks,
+    follow_pmu_signal_file), UniformTimeAxis, statistics and SignalCatalog
+    run on numpy alone, so short-lived CLIs and pool workers start fast.
+    The module does not configure logging; call logging.basicConfig(...) in
+    the application to see its INFO messages.
 
 Author: Generated for Green Construction Task 5
 Date: September 2025
 """
 
+from __future__ import annotations
+
 import os
+import time
+import json
+import bisect
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-import pandas as pd
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, Mapping, Optional, Sequence, Tuple, Union
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
+# Map filename data types to numpy dtypes
+DTYPE_MAPPING = {
+    'Float32': np.float32,
+    'Float64': np.float64,
+    'Int32': np.int32,
+    'Int16': np.int16,
+    'UInt32': np.uint32,
+    'UInt16': np.uint16
+}
+
+# Summary statistics engine settings
+STATS_SIDECAR_SUFFIX = '.stats.json'
+STATS_CHUNK_POINTS = 1 << 22          # samples per chunk (16 MB of Float32)
+STATS_PERCENTILE_SAMPLES = 100_000    # evenly strided samples used for approximate percentiles
+STATS_PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+
+# Multi-resolution min/max/mean pyramid (levels in seconds; each a multiple of the first)
+PYRAMID_SIDECAR_SUFFIX = '.pyramid.npz'
+PYRAMID_LEVELS_SECONDS = (1, 10, 60, 600)
+
+# Catalog file written at the root of a cataloged directory tree
+CATALOG_FILENAME = '.signal_catalog.json'
+
+
 class PMUDataError(Exception):
     """Custom exception for PMU data processing errors"""
     pass
 
 
+def _pandas():
+    """Import pandas on first use, so the numpy-only core never pays for it."""
+    import pandas
+    return pandas
+
+
+def to_datetime64(t: Union[datetime, np.datetime64, pd.Timestamp, str]) -> np.datetime64:
+    """
+    Convert a timezone-naive datetime-like value to np.datetime64[ns] without pandas.
+    
+    Args:
+        t (datetime, np.datetime64, pd.Timestamp or str): Time to convert
+        
+    Returns:
+        np.datetime64: The time with nanosecond resolution
+        
+    Raises:
+        PMUDataError: If t is timezone-aware (filename times are naive)
+    """
+    if getattr(t, 'tzinfo', None) is not None:
+        raise PMUDataError(f"Signal file timestamps are timezone-naive; got timezone-aware time: {t}")
+    # pd.Timestamp carries nanoseconds that np.datetime64(datetime) would drop
+    if hasattr(t, 'to_datetime64'):
+        t = t.to_datetime64()
+    return np.datetime64(t, 'ns')
+
+
+def resolve_dtype(data_type: str) -> np.dtype:
+    """
+    Resolve the numpy dtype for a data type name from a signal filename.
+    
+    Args:
+        data_type (str): Data type field from the filename (e.g. 'Float32')
+        
+    Returns:
+        np.dtype: Matching numpy dtype, Float32 if the name is unknown
+    """
+    if data_type not in DTYPE_MAPPING:
+        logger.warning(f"Unknown data type '{data_type}', defaulting to Float32")
+        return np.dtype(np.float32)
+    return np.dtype(DTYPE_MAPPING[data_type])
+
+
 def validate_signal_file(file_path: str) -> None:
     """
     Validate that the file exists and has the correct .signal extension.
@@ -189,39 +309,82 @@ def create_start_datetime(date_str: str, time_str: str) -> datetime:
         raise PMUDataError(f"Failed to parse datetime from filename parts '{date_str}', '{time_str}': {e}")
 
 
-def read_signal_data(file_path: str, data_type: str = "Float32") -> np.ndarray:
+def time_window_to_sample_range(start_datetime: datetime, frequency: int, num_points: int,
+                                start: Optional[Union[datetime, pd.Timestamp]] = None,
+                                end: Optional[Union[datetime, pd.Timestamp]] = None) -> Tuple[int, int]:
+    """
+    Convert a time window into a half-open sample index range [first, stop).
+    
+    Sample i is taken at start_datetime + i * period, with the same truncated
+    nanosecond period as create_timestamps and UniformTimeAxis, so a windowed
+    read returns exactly the samples a full read trimmed to the window would.
+    Both window bounds are inclusive, matching how the analysis notebooks trim
+    to RUN_START/RUN_END.
+    
+    Args:
+        start_datetime (datetime): Timestamp of the first sample in the file
+        frequency (int): Sampling frequency in Hz
+        num_points (int): Number of samples in the file
+        start (datetime, optional): First time to include (default: file start)
+        end (datetime, optional): Last time to include (default: file end)
+        
+    Returns:
+        Tuple[int, int]: (first, stop) sample indices, clipped to [0, num_points]
+        
+    Raises:
+        PMUDataError: If a bound is timezone-aware (filename times are naive)
+    """
+    axis = UniformTimeAxis.from_frequency(start_datetime, frequency, num_points)
+    window = axis.slice_between(None if start is None else to_datetime64(start),
+                                None if end is None else to_datetime64(end))
+    return window.start, window.stop
+
+
+def read_signal_data(file_path: str, data_type: str = "Float32", mmap: bool = False,
+                     offset: int = 0, count: int = -1) -> np.ndarray:
     """
     Read binary signal data from file.
     
+    With mmap=True the file is memory-mapped read-only instead of copied into RAM:
+    the returned np.memmap shares the page cache and samples are only paged in
+    when they are touched. A trailing partial sample is ignored in both modes.
+    
+    offset and count select a sample range; the reader seeks to
+    offset * itemsize and reads only count samples, so the I/O cost is
+    proportional to the range rather than the file.
+    
     Args:
         file_path (str): Path to the signal file
         data_type (str): Data type for reading binary data (default: Float32)
+        mmap (bool): Return a read-only np.memmap instead of an in-memory copy
+        offset (int): Index of the first sample to read (default: 0)
+        count (int): Number of samples to read, -1 for all remaining (default: -1)
         
     Returns:
-        np.ndarray: Array of signal values
+        np.ndarray: Array of signal values (np.memmap when mmap=True)
         
     Raises:
         PMUDataError: If data reading fails
     """
     try:
-        # Map data types to numpy dtypes
-        dtype_mapping = {
-            'Float32': np.float32,
-            'Float64': np.float64,
-            'Int32': np.int32,
-            'Int16': np.int16,
-            'UInt32': np.uint32,
-            'UInt16': np.uint16
-        }
+        dtype = resolve_dtype(data_type)
         
-        if data_type not in dtype_mapping:
-            logger.warning(f"Unknown data type '{data_type}', defaulting to Float32")
-            dtype = np.float32
-        else:
-            dtype = dtype_mapping[data_type]
+        if offset < 0:
+            raise ValueError(f"Sample offset must be non-negative, got: {offset}")
+        
+        available = os.path.getsize(file_path) // dtype.itemsize - offset
+        if count < 0 or count > available:
+            count = max(available, 0)
+        
+        if count == 0:
+            raise PMUDataError(f"No data could be read from file: {file_path}")
+        
+        if mmap:
+            return np.memmap(file_path, dtype=dtype, mode='r',
+                             offset=offset * dtype.itemsize, shape=(count,))
         
         # Read binary data
-        data = np.fromfile(file_path, dtype=dtype)
+        data = np.fromfile(file_path, dtype=dtype, count=count, offset=offset * dtype.itemsize)
         
         if len(data) == 0:
             raise PMUDataError(f"No data could be read from file: {file_path}")
@@ -232,6 +395,137 @@ def read_signal_data(file_path: str, data_type: str = "Float32") -> np.ndarray:
         raise PMUDataError(f"Failed to read signal data from {file_path}: {e}")
 
 
+def summarize_signal_values(chunks, total_points: int,
+                            percentiles: Sequence[float] = STATS_PERCENTILES) -> dict:
+    """
+    Single-pass summary statistics over an iterable of sample chunks.
+    
+    Only running totals and an evenly strided sample (about
+    STATS_PERCENTILE_SAMPLES points, used for the approximate percentiles) are
+    kept, so memory stays constant regardless of how many samples are seen.
+    NaN values are counted and excluded from every other statistic.
+    
+    Args:
+        chunks (iterable): Iterable of 1-D numpy arrays, in file order
+        total_points (int): Total number of samples across all chunks (sets the sampling stride)
+        percentiles (Sequence[float]): Percentiles to estimate, 0-100
+        
+    Returns:
+        dict: count, nan_count, zero_count, nonzero_count, min, max, mean,
+        nonzero_min, nonzero_max and percentiles ({str(p): value})
+    """
+    stride = max(1, total_points // STATS_PERCENTILE_SAMPLES)
+    count = nan_count = zero_count = finite_count = 0
+    total = 0.0
+    vmin = vmax = nz_min = nz_max = np.nan
+    sampled = []
+    position = 0
+    
+    for chunk in chunks:
+        chunk = np.asarray(chunk)
+        if chunk.dtype.kind == 'f':
+            nan_mask = np.isnan(chunk)
+            chunk_nans = int(nan_mask.sum())
+            finite = chunk[~nan_mask] if chunk_nans else chunk
+        else:
+            chunk_nans = 0
+            finite = chunk
+        
+        # Strided sample aligned to the global sample index
+        sampled.append(chunk[(-position) % stride::stride])
+        position += len(chunk)
+        
+        count += len(chunk)
+        nan_count += chunk_nans
+        if len(finite) == 0:
+            continue
+        finite_count += len(finite)
+        total += float(finite.sum(dtype=np.float64))
+        vmin = np.nanmin([vmin, finite.min()])
+        vmax = np.nanmax([vmax, finite.max()])
+        
+        nonzero = finite[finite != 0]
+        zero_count += len(finite) - len(nonzero)
+        if len(nonzero):
+            nz_min = np.nanmin([nz_min, nonzero.min()])
+            nz_max = np.nanmax([nz_max, nonzero.max()])
+    
+    sample = np.concatenate(sampled).astype(np.float64) if sampled else np.empty(0)
+    sample = sample[~np.isnan(sample)]
+    if len(sample):
+        estimates = np.percentile(sample, percentiles)
+    else:
+        estimates = [np.nan] * len(percentiles)
+    
+    return {
+        'count': count,
+        'nan_count': nan_count,
+        'zero_count': zero_count,
+        'nonzero_count': finite_count - zero_count,
+        'min': float(vmin),
+        'max': float(vmax),
+        'mean': total / finite_count if finite_count else float('nan'),
+        'nonzero_min': float(nz_min),
+        'nonzero_max': float(nz_max),
+        'percentiles': {str(p): float(v) for p, v in zip(percentiles, estimates)},
+    }
+
+
+def compute_signal_stats(file_path: str, data_type: str = "Float32",
+                         percentiles: Sequence[float] = STATS_PERCENTILES,
+                         use_cache: bool = True) -> dict:
+    """
+    Out-of-core summary statistics for a signal file, cached in a sidecar.
+    
+    The file is memory-mapped and scanned in STATS_CHUNK_POINTS chunks, so
+    memory use does not grow with file size. Results are stored next to the
+    file as '<file>.stats.json', keyed by file size and mtime; a later call on
+    an unchanged file returns the cached statistics without touching the data.
+    
+    Args:
+        file_path (str): Path to the signal file
+        data_type (str): Data type for reading binary data (default: Float32)
+        percentiles (Sequence[float]): Percentiles to estimate, 0-100
+        use_cache (bool): Read and write the sidecar cache (default: True)
+        
+    Returns:
+        dict: Statistics as returned by summarize_signal_values
+        
+    Raises:
+        PMUDataError: If the data cannot be read
+    """
+    sidecar_path = file_path + STATS_SIDECAR_SUFFIX
+    file_stat = os.stat(file_path)
+    key = {
+        'file_size_bytes': file_stat.st_size,
+        'mtime_ns': file_stat.st_mtime_ns,
+        'data_type': data_type,
+        'percentiles': [str(p) for p in percentiles],
+    }
+    
+    if use_cache and os.path.exists(sidecar_path):
+        try:
+            with open(sidecar_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('key') == key:
+                return cached['stats']
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable stats sidecar {sidecar_path}: {e}")
+    
+    values = read_signal_data(file_path, data_type, mmap=True)
+    chunks = (values[i:i + STATS_CHUNK_POINTS] for i in range(0, len(values), STATS_CHUNK_POINTS))
+    stats = summarize_signal_values(chunks, len(values), percentiles)
+    
+    if use_cache:
+        try:
+            with open(sidecar_path, 'w', encoding='utf-8') as f:
+                json.dump({'key': key, 'stats': stats}, f, indent=2)
+        except OSError as e:
+            logger.warning(f"Could not write stats sidecar {sidecar_path}: {e}")
+    
+    return stats
+
+
 def create_timestamps(start_datetime: datetime, num_points: int, frequency: int) -> pd.DatetimeIndex:
     """
     Create timestamps for signal data points based on sampling frequency.
@@ -254,6 +548,8 @@ def create_timestamps(start_datetime: datetime, num_points: int, frequency: int)
         if num_points <= 0:
             raise ValueError(f"Number of points must be positive, got: {num_points}")
         
+        pd = _pandas()
+        
         # Calculate time interval between samples
         time_interval = pd.Timedelta(seconds=1.0 / frequency)
         
@@ -270,7 +566,162 @@ def create_timestamps(start_datetime: datetime, num_points: int, frequency: int)
         raise PMUDataError(f"Failed to create timestamps: {e}")
 
 
-def read_pmu_signal_file(file_path: str) -> pd.DataFrame:
+class UniformTimeAxis:
+    """
+    Implicit time axis for uniformly sampled signals.
+    
+    Stores only the first timestamp, the sample period and the sample count
+    (24 bytes) instead of one datetime64 per sample. Sample i is taken at
+    start + i * period, using the same nanosecond period as create_timestamps,
+    so materializing the axis gives exactly the index a DataFrame read would.
+    
+    Example:
+        values, axis = read_pmu_signal_file('file.signal', raw=True)
+        axis.time_at(0)                      # first timestamp
+        i = axis.index_at(some_datetime)     # nearest sample at/after a time
+        sub = axis[1000:2000]                # sliced axis, still 24 bytes
+        idx = sub.to_datetimeindex()         # materialize only when needed
+    """
+    
+    def __init__(self, start: Union[datetime, np.datetime64], period: Union[int, np.timedelta64], count: int):
+        """
+        Args:
+            start (datetime): Timestamp of sample 0 (timezone-naive)
+            period (int or np.timedelta64): Sample period, int values are nanoseconds
+            count (int): Number of samples
+            
+        Raises:
+            PMUDataError: If period is not positive or count is negative
+        """
+        self.start = to_datetime64(start)
+        self.period = np.timedelta64(period, 'ns')
+        self.count = int(count)
+        if self.period <= np.timedelta64(0, 'ns'):
+            raise PMUDataError(f"Time axis period must be positive, got: {self.period}")
+        if self.count < 0:
+            raise PMUDataError(f"Time axis count must be non-negative, got: {self.count}")
+    
+    @classmethod
+    def from_frequency(cls, start: Union[datetime, np.datetime64], frequency: int, count: int) -> 'UniformTimeAxis':
+        """
+        Build an axis from a sampling frequency in Hz (as parsed from a filename).
+        
+        Args:
+            start (datetime): Timestamp of sample 0
+            frequency (int): Sampling frequency in Hz
+            count (int): Number of samples
+            
+        Returns:
+            UniformTimeAxis: The time axis
+        """
+        if frequency <= 0:
+            raise PMUDataError(f"Frequency must be positive, got: {frequency}")
+        return cls(start, int(1e9 / frequency), count)
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def __repr__(self) -> str:
+        return f"UniformTimeAxis(start={self.start}, period={self.period}, count={self.count})"
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, UniformTimeAxis):
+            return NotImplemented
+        return (self.start, self.period, self.count) == (other.start, other.period, other.count)
+    
+    @property
+    def end(self) -> np.datetime64:
+        """Timestamp of the last sample (start if the axis is empty)."""
+        return self.start + max(self.count - 1, 0) * self.period
+    
+    @property
+    def frequency(self) -> float:
+        """Sampling frequency in Hz."""
+        return 1e9 / self.period.astype(np.int64)
+    
+    def time_at(self, index):
+        """
+        Timestamp(s) of the given sample index or array of indices.
+        
+        Args:
+            index (int or array-like): Sample index/indices; negative values count from the end
+            
+        Returns:
+            np.datetime64 or np.ndarray: datetime64[ns] timestamp(s)
+        """
+        index = np.asarray(index, dtype=np.int64)
+        index = np.where(index < 0, index + self.count, index)
+        return self.start + index * self.period
+    
+    def index_at(self, times, side: str = 'left'):
+        """
+        Sample index for the given time(s), with np.searchsorted semantics.
+        
+        side='left' returns the first sample at or after each time, side='right'
+        the first sample strictly after it. Results are clipped to [0, count].
+        
+        Args:
+            times (datetime or array-like): Time(s) to look up (timezone-naive)
+            side (str): 'left' or 'right'
+            
+        Returns:
+            int or np.ndarray: Sample index/indices
+        """
+        if side not in ('left', 'right'):
+            raise PMUDataError(f"side must be 'left' or 'right', got: {side}")
+        offset = (np.asarray(times, dtype='datetime64[ns]') - self.start).astype(np.int64)
+        period = self.period.astype(np.int64)
+        if side == 'left':
+            index = -(-offset // period)
+        else:
+            index = offset // period + 1
+        index = np.clip(index, 0, self.count)
+        return int(index) if index.ndim == 0 else index
+    
+    def __getitem__(self, key: slice) -> 'UniformTimeAxis':
+        if not isinstance(key, slice):
+            raise TypeError("UniformTimeAxis only supports slicing; use time_at() for single samples")
+        first, stop, step = key.indices(self.count)
+        if step <= 0:
+            raise PMUDataError(f"Time axis slices must have a positive step, got: {step}")
+        count = len(range(first, stop, step))
+        return UniformTimeAxis(self.start + first * self.period, self.period * step, count)
+    
+    def slice_between(self, start=None, end=None) -> slice:
+        """
+        Index slice covering the samples between start and end (both inclusive).
+        
+        Args:
+            start (datetime, optional): First time to include (default: axis start)
+            end (datetime, optional): Last time to include (default: axis end)
+            
+        Returns:
+            slice: Slice usable on both the axis and the value array
+        """
+        first = 0 if start is None else self.index_at(start, side='left')
+        stop = self.count if end is None else self.index_at(end, side='right')
+        return slice(first, max(stop, first))
+    
+    def to_datetimeindex(self, name: Optional[str] = 'timestamp') -> pd.DatetimeIndex:
+        """
+        Materialize the axis as a pandas DatetimeIndex (8 bytes per sample).
+        
+        Args:
+            name (str, optional): Name of the returned index (default: 'timestamp')
+            
+        Returns:
+            pd.DatetimeIndex: The timestamps of every sample
+        """
+        pd = _pandas()
+        ns = self.start.astype(np.int64) + np.arange(self.count, dtype=np.int64) * self.period.astype(np.int64)
+        return pd.DatetimeIndex(ns.view('datetime64[ns]'), name=name)
+
+
+def read_pmu_signal_file(file_path: str, mmap: bool = False,
+                         start: Optional[Union[datetime, pd.Timestamp]] = None,
+                         end: Optional[Union[datetime, pd.Timestamp]] = None,
+                         raw: bool = False,
+                         log_stats: bool = False) -> Union[pd.DataFrame, Tuple[np.ndarray, UniformTimeAxis]]:
     """
     Read a PMU signal file and return a DataFrame with timestamps and values.
     
@@ -282,11 +733,31 @@ def read_pmu_signal_file(file_path: str) -> pd.DataFrame:
     5. Create timestamps
     6. Return DataFrame
     
+    With mmap=True the 'value' column is backed directly by a read-only memory map
+    of the file (no copy), and the full-data summary statistics are skipped so that
+    no sample is touched until the caller uses it.
+    
+    start/end restrict the read to a time window (both inclusive). The window is
+    converted to a byte range from the filename start time and sample rate, so
+    only the samples inside it are read from disk.
+    
+    With raw=True no timestamps or DataFrame are built: the raw value array is
+    returned together with a UniformTimeAxis describing its sample times.
+    
+    Summary statistics (zero count, value ranges) are only computed and logged
+    when log_stats=True; use get_pmu_file_info(stats=True) for cached ones.
+    
     Args:
         file_path (str): Path to the .signal file
+        mmap (bool): Back the 'value' column with a zero-copy np.memmap
+        start (datetime, optional): First time to include (default: file start)
+        end (datetime, optional): Last time to include (default: file end)
+        raw (bool): Return (values, UniformTimeAxis) instead of a DataFrame
+        log_stats (bool): Compute and log summary statistics of the values read
         
     Returns:
-        pd.DataFrame: DataFrame with 'timestamp' and 'value' columns
+        pd.DataFrame: DataFrame with 'timestamp' and 'value' columns, or
+        Tuple[np.ndarray, UniformTimeAxis] when raw=True
         
     Raises:
         PMUDataError: If any step in the processing fails
@@ -305,27 +776,41 @@ def read_pmu_signal_file(file_path: str) -> pd.DataFrame:
         start_datetime = create_start_datetime(date_str, time_str)
         logger.info(f"Start datetime: {start_datetime}")
         
-        # Step 4: Read signal data
-        signal_data = read_signal_data(file_path, data_type)
-        logger.info(f"Read {len(signal_data)} data points, range: {signal_data.min()} to {signal_data.max()}")
+        # Step 4: Read signal data (only the requested window, if any)
+        first, count = 0, -1
+        if start is not None or end is not None:
+            total_points = os.path.getsize(file_path) // resolve_dtype(data_type).itemsize
+            first, stop = time_window_to_sample_range(start_datetime, frequency, total_points, start, end)
+            if stop <= first:
+                raise PMUDataError(f"No samples between {start} and {end} in {file_path}")
+            count = stop - first
+            logger.info(f"Reading samples {first} to {stop} of {total_points}")
+        
+        signal_data = read_signal_data(file_path, data_type, mmap=mmap, offset=first, count=count)
+        logger.info(f"Read {len(signal_data)} data points{' (memory-mapped)' if mmap else ''}")
         
-        # Step 5: Create timestamps
-        timestamps = create_timestamps(start_datetime, len(signal_data), frequency)
+        if log_stats:
+            chunks = (signal_data[i:i + STATS_CHUNK_POINTS] for i in range(0, len(signal_data), STATS_CHUNK_POINTS))
+            stats = summarize_signal_values(chunks, len(signal_data))
+            logger.info(f"Value range: {stats['min']} to {stats['max']}, Zero values: {stats['zero_count']}, "
+                        f"Non-zero values: {stats['nonzero_count']}, NaN values: {stats['nan_count']}")
+            if stats['nonzero_count'] > 0:
+                logger.info(f"Non-zero value range: {stats['nonzero_min']} to {stats['nonzero_max']}")
         
-        # Step 6: Create DataFrame
+        # Step 5: Time axis (same per-sample step as create_timestamps, so windowed
+        # timestamps match a full read)
+        axis = UniformTimeAxis.from_frequency(start_datetime, frequency, first + len(signal_data))[first:]
+        if raw:
+            return signal_data, axis
+        timestamps = axis.to_datetimeindex(name=None)
+        
+        # Step 6: Create DataFrame (copy=False keeps the memmap as the column's storage)
+        pd = _pandas()
         df = pd.DataFrame({
             'timestamp': timestamps,
             'value': signal_data
-        })
-        
-        # Log summary statistics
-        zero_count = len(df[df.value == 0])
-        non_zero_count = len(df[df.value != 0])
-        logger.info(f"DataFrame created - Shape: {df.shape}, Zero values: {zero_count}, Non-zero values: {non_zero_count}")
-        
-        if non_zero_count > 0:
-            non_zero_data = df[df.value != 0].value
-            logger.info(f"Non-zero value range: {non_zero_data.min()} to {non_zero_data.max()}")
+        }, copy=not mmap)
+        logger.info(f"DataFrame created - Shape: {df.shape}{' (memory-mapped)' if mmap else ''}")
         
         return df
         
@@ -337,18 +822,471 @@ def read_pmu_signal_file(file_path: str) -> pd.DataFrame:
         raise PMUDataError(f"Unexpected error processing PMU signal file {file_path}: {e}")
 
 
-def read_pmu_signal_file_safe(file_path: str) -> Optional[pd.DataFrame]:
+def iter_pmu_signal_chunks(file_path: str, chunk_seconds: float, overlap_samples: int = 0,
+                           start: Optional[Union[datetime, pd.Timestamp]] = None,
+                           end: Optional[Union[datetime, pd.Timestamp]] = None
+                           ) -> Iterator[Tuple[np.datetime64, np.ndarray]]:
+    """
+    Iterate over a PMU signal file in fixed-duration blocks with constant memory.
+    
+    Each block holds round(chunk_seconds * frequency) new samples, so block
+    boundaries fall on whole samples at multiples of the chunk length from the
+    start of the read. With overlap_samples > 0 every block after the first is
+    prefixed with the last overlap_samples samples of the previous block, which
+    keeps windowed FFTs and filters correct across block edges. The final block
+    may be shorter. Only one block (plus the overlap) is in memory at a time.
+    
+    Args:
+        file_path (str): Path to the .signal file
+        chunk_seconds (float): Duration of new data per block, in seconds
+        overlap_samples (int): Samples repeated from the previous block (default: 0)
+        start (datetime, optional): First time to include (default: file start)
+        end (datetime, optional): Last time to include (default: file end)
+        
+    Yields:
+        Tuple[np.datetime64, np.ndarray]: (timestamp of the block's first sample, samples)
+        
+    Raises:
+        PMUDataError: If the file is invalid or the chunk/overlap sizes are not usable
+    """
+    validate_signal_file(file_path)
+    date_str, time_str, frequency, data_type = parse_signal_filename(os.path.basename(file_path))
+    start_datetime = create_start_datetime(date_str, time_str)
+    dtype = resolve_dtype(data_type)
+    total_points = os.path.getsize(file_path) // dtype.itemsize
+    
+    chunk_samples = int(round(chunk_seconds * frequency))
+    if chunk_samples < 1:
+        raise PMUDataError(f"chunk_seconds={chunk_seconds} is shorter than one sample at {frequency}Hz")
+    if overlap_samples < 0:
+        raise PMUDataError(f"overlap_samples must be non-negative, got: {overlap_samples}")
+    
+    first, stop = time_window_to_sample_range(start_datetime, frequency, total_points, start, end)
+    axis = UniformTimeAxis.from_frequency(start_datetime, frequency, total_points)
+    
+    tail = np.empty(0, dtype=dtype)
+    try:
+        with open(file_path, 'rb') as f:
+            f.seek(first * dtype.itemsize)
+            position = first
+            while position < stop:
+                count = min(chunk_samples, stop - position)
+                new = np.fromfile(f, dtype=dtype, count=count)
+                if len(new) == 0:
+                    break
+                block = np.concatenate([tail, new]) if len(tail) else new
+                yield axis.time_at(position - len(tail)), block
+                position += len(new)
+                if overlap_samples:
+                    tail = block[-overlap_samples:].copy()
+    except OSError as e:
+        raise PMUDataError(f"Failed to read signal data from {file_path}: {e}")
+
+
+def follow_pmu_signal_file(file_path: str, poll_interval: float = 0.1, from_start: bool = False,
+                           idle_timeout: Optional[float] = None
+                           ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Follow a PMU signal file that is still being appended to, like `tail -f`.
+    
+    The file size is polled every poll_interval seconds and only the bytes
+    past the last whole sample already yielded are read, so each poll costs
+    O(new bytes). A partially written trailing sample is left on disk until
+    the rest of it arrives. Timestamps come from the filename start time and
+    frequency, using the same per-sample step as read_pmu_signal_file.
+    
+    Args:
+        file_path (str): Path to the .signal file (may still be empty)
+        poll_interval (float): Seconds between size checks (default: 0.1)
+        from_start (bool): Yield the data already in the file first (default: False,
+            start from the current end of the file)
+        idle_timeout (float, optional): Stop after this many seconds without new
+            data (default: None, follow forever)
+        
+    Yields:
+        Tuple[np.ndarray, np.ndarray]: (datetime64[ns] timestamps, values) of new samples
+        
+    Raises:
+        PMUDataError: If the file is missing, badly named, or shrinks while followed
+    """
+    if not os.path.exists(file_path):
+        raise PMUDataError(f"Signal file not found: {file_path}")
+    if not file_path.endswith('.signal'):
+        raise PMUDataError(f"File must have .signal extension, got: {os.path.basename(file_path)}")
+    
+    date_str, time_str, frequency, data_type = parse_signal_filename(os.path.basename(file_path))
+    start_datetime = create_start_datetime(date_str, time_str)
+    dtype = resolve_dtype(data_type)
+    period_ns = UniformTimeAxis.from_frequency(start_datetime, frequency, 0).period.astype(np.int64)
+    start_ns = np.datetime64(start_datetime, 'ns').astype(np.int64)
+    
+    position = 0 if from_start else os.path.getsize(file_path) // dtype.itemsize
+    last_data_time = time.monotonic()
+    logger.info(f"Following {file_path} from sample {position}")
+    
+    try:
+        with open(file_path, 'rb') as f:
+            while True:
+                available = os.fstat(f.fileno()).st_size // dtype.itemsize
+                if available < position:
+                    raise PMUDataError(f"Signal file shrank while being followed: {file_path}")
+                if available > position:
+                    f.seek(position * dtype.itemsize)
+                    values = np.fromfile(f, dtype=dtype, count=available - position)
+                    timestamps = (start_ns + (position + np.arange(len(values), dtype=np.int64)) * period_ns).view('datetime64[ns]')
+                    position += len(values)
+                    last_data_time = time.monotonic()
+                    yield timestamps, values
+                    continue
+                if idle_timeout is not None and time.monotonic() - last_data_time >= idle_timeout:
+                    logger.info(f"No new data in {file_path} for {idle_timeout}s, stopping follow")
+                    return
+                time.sleep(poll_interval)
+    except OSError as e:
+        raise PMUDataError(f"Failed to follow signal file {file_path}: {e}")
+
+
+def _pyramid_key(file_path: str, data_type: str, levels_seconds: Sequence[int]) -> str:
+    file_stat = os.stat(file_path)
+    return json.dumps({
+        'file_size_bytes': file_stat.st_size,
+        'mtime_ns': file_stat.st_mtime_ns,
+        'data_type': data_type,
+        'levels_seconds': [int(level) for level in levels_seconds],
+    }, sort_keys=True)
+
+
+def build_signal_pyramid(file_path: str, levels_seconds: Sequence[int] = PYRAMID_LEVELS_SECONDS) -> str:
+    """
+    Precompute min/max/mean decimation levels for a signal file.
+    
+    One streaming pass over read_signal_data (memory-mapped, in bin-aligned
+    chunks) produces the finest level; coarser levels are aggregated from it,
+    so every level must be a whole multiple of the first. NaN samples are
+    ignored; bins with no finite samples are NaN. The levels are written as
+    float32 arrays to '<file>.pyramid.npz' next to the file, keyed by file
+    size and mtime.
+    
+    Args:
+        file_path (str): Path to the .signal file
+        levels_seconds (Sequence[int]): Bin widths in seconds, finest first
+            (default: PYRAMID_LEVELS_SECONDS)
+        
+    Returns:
+        str: Path of the written pyramid file
+        
+    Raises:
+        PMUDataError: If the file cannot be read or the levels are not nested
+    """
+    validate_signal_file(file_path)
+    _, _, frequency, data_type = parse_signal_filename(os.path.basename(file_path))
+    levels_seconds = [int(level) for level in levels_seconds]
+    if not levels_seconds or levels_seconds[0] <= 0 or any(level % levels_seconds[0] for level in levels_seconds):
+        raise PMUDataError(f"Pyramid levels must be positive multiples of the finest level, got: {levels_seconds}")
+    
+    values = read_signal_data(file_path, data_type, mmap=True)
+    bin_samples = levels_seconds[0] * frequency
+    num_bins = -(-len(values) // bin_samples)
+    sums = np.zeros(num_bins, dtype=np.float64)
+    counts = np.zeros(num_bins, dtype=np.int64)
+    mins = np.full(num_bins, np.inf, dtype=np.float64)
+    maxs = np.full(num_bins, -np.inf, dtype=np.float64)
+    
+    chunk_points = max(1, STATS_CHUNK_POINTS // bin_samples) * bin_samples
+    for offset in range(0, len(values), chunk_points):
+        chunk = np.asarray(values[offset:offset + chunk_points], dtype=np.float64)
+        pad = -len(chunk) % bin_samples
+        if pad:
+            chunk = np.concatenate([chunk, np.full(pad, np.nan)])
+        bins = chunk.reshape(-1, bin_samples)
+        finite = ~np.isnan(bins)
+        first_bin = offset // bin_samples
+        sl = slice(first_bin, first_bin + len(bins))
+        sums[sl] = np.where(finite, bins, 0.0).sum(axis=1)
+        counts[sl] = finite.sum(axis=1)
+        mins[sl] = np.where(finite, bins, np.inf).min(axis=1)
+        maxs[sl] = np.where(finite, bins, -np.inf).max(axis=1)
+    
+    arrays = {'key': np.array(_pyramid_key(file_path, data_type, levels_seconds))}
+    for level in levels_seconds:
+        factor = level // levels_seconds[0]
+        pad = -num_bins % factor
+        def group(a, fill, reduce):
+            return reduce(np.concatenate([a, np.full(pad, fill, dtype=a.dtype)]).reshape(-1, factor), axis=1)
+        level_sums = group(sums, 0.0, np.sum)
+        level_counts = group(counts, 0, np.sum)
+        empty = level_counts == 0
+        with np.errstate(invalid='ignore', divide='ignore'):
+            arrays[f'mean_{level}'] = np.where(empty, np.nan, level_sums / level_counts).astype(np.float32)
+        arrays[f'min_{level}'] = np.where(empty, np.nan, group(mins, np.inf, np.min)).astype(np.float32)
+        arrays[f'max_{level}'] = np.where(empty, np.nan, group(maxs, -np.inf, np.max)).astype(np.float32)
+    
+    pyramid_path = file_path + PYRAMID_SIDECAR_SUFFIX
+    try:
+        with open(pyramid_path, 'wb') as f:
+            np.savez(f, **arrays)
+    except OSError as e:
+        raise PMUDataError(f"Could not write signal pyramid {pyramid_path}: {e}")
+    logger.info(f"Built signal pyramid for {file_path}: levels {levels_seconds}s, {num_bins} finest bins")
+    return pyramid_path
+
+
+def query_signal_pyramid(file_path: str, num_points: int,
+                         start: Optional[Union[datetime, pd.Timestamp]] = None,
+                         end: Optional[Union[datetime, pd.Timestamp]] = None,
+                         levels_seconds: Sequence[int] = PYRAMID_LEVELS_SECONDS,
+                         build: bool = True) -> pd.DataFrame:
+    """
+    Min/max/mean overview of a signal file for plotting, from its pyramid.
+    
+    Picks the coarsest pyramid level that still gives at least num_points bins
+    in the requested window. If even the finest level is too coarse, the raw
+    samples of the window are returned (min = max = mean = value). The pyramid
+    is (re)built first if it is missing or stale and build=True.
+    
+    Args:
+        file_path (str): Path to the .signal file
+        num_points (int): Minimum number of points wanted in the window
+        start (datetime, optional): First time to include (default: file start)
+        end (datetime, optional): Last time to include (default: file end)
+        levels_seconds (Sequence[int]): Pyramid levels (default: PYRAMID_LEVELS_SECONDS)
+        build (bool): Build the pyramid if missing or stale (default: True)
+        
+    Returns:
+        pd.DataFrame: 'timestamp' (bin start), 'min', 'max' and 'mean' columns;
+        df.attrs['level_seconds'] holds the chosen bin width (0 for raw samples)
+        
+    Raises:
+        PMUDataError: If the file is invalid or the pyramid is missing and build=False
+    """
+    validate_signal_file(file_path)
+    date_str, time_str, frequency, data_type = parse_signal_filename(os.path.basename(file_path))
+    start_datetime = create_start_datetime(date_str, time_str)
+    total_points = os.path.getsize(file_path) // resolve_dtype(data_type).itemsize
+    first, stop = time_window_to_sample_range(start_datetime, frequency, total_points, start, end)
+    
+    pyramid_path = file_path + PYRAMID_SIDECAR_SUFFIX
+    key = _pyramid_key(file_path, data_type, levels_seconds)
+    stale = True
+    if os.path.exists(pyramid_path):
+        with np.load(pyramid_path) as pyramid:
+            stale = str(pyramid['key']) != key
+    if stale:
+        if not build:
+            raise PMUDataError(f"No up-to-date signal pyramid for {file_path}")
+        pyramid_path = build_signal_pyramid(file_path, levels_seconds)
+    
+    pd = _pandas()
+    for level in sorted(levels_seconds, reverse=True):
+        bin_samples = level * frequency
+        first_bin = first // bin_samples
+        stop_bin = -(-stop // bin_samples)
+        if stop_bin - first_bin >= num_points:
+            bins_axis = UniformTimeAxis(start_datetime, level * 1_000_000_000, stop_bin)
+            timestamps = bins_axis[first_bin:stop_bin].to_datetimeindex()
+            # Read only the chosen level and close the file (an open .npz blocks rebuilds on Windows)
+            with np.load(pyramid_path) as pyramid:
+                columns = {name: pyramid[f'{name}_{level}'][first_bin:stop_bin].copy()
+                           for name in ('min', 'max', 'mean')}
+            df = pd.DataFrame({'timestamp': timestamps, **columns})
+            df.attrs['level_seconds'] = level
+            return df
+    
+    values, axis = read_pmu_signal_file(file_path, start=start, end=end, raw=True)
+    df = pd.DataFrame({'timestamp': axis.to_datetimeindex(), 'min': values, 'max': values, 'mean': values})
+    df.attrs['level_seconds'] = 0
+    return df
+
+
+def read_pmu_signal_files(file_paths: Sequence[str], trim_overlaps: bool = False) -> Tuple[pd.DataFrame, list]:
+    """
+    Read consecutive PMU signal files into one continuous DataFrame.
+    
+    Files are ordered by their filename start time. One output buffer is
+    preallocated from the summed estimated_data_points and each file is read
+    straight into its slice, so there is no repeated concatenation. Gaps and
+    overlaps between consecutive files are computed from the filename start
+    times and sample rates (tolerance: half a sample period) and returned
+    instead of being hidden.
+    
+    Args:
+        file_paths (Sequence[str]): Paths to .signal files of one channel
+        trim_overlaps (bool): Drop samples of a file that fall before the end of
+            the previous file (default: False, keep every sample)
+        
+    Returns:
+        Tuple[pd.DataFrame, list]: DataFrame with 'timestamp' and 'value' columns,
+        and a list of discontinuity dicts with keys 'type' ('gap' or 'overlap'),
+        'previous_file', 'next_file', 'previous_end', 'next_start', 'seconds'
+        and 'samples'
+        
+    Raises:
+        PMUDataError: If no files are given, files mix sample rates or data
+            types, or a file cannot be read
+    """
+    if len(file_paths) == 0:
+        raise PMUDataError("No signal files given")
+    
+    pd = _pandas()
+    infos = sorted((get_pmu_file_info(path) for path in file_paths), key=lambda info: info['start_datetime'])
+    frequency = infos[0]['frequency_hz']
+    data_type = infos[0]['data_type']
+    for info in infos[1:]:
+        if info['frequency_hz'] != frequency or info['data_type'] != data_type:
+            raise PMUDataError(
+                f"Cannot stitch {info['filename']} ({info['frequency_hz']}Hz, {info['data_type']}) "
+                f"onto {frequency}Hz {data_type} files"
+            )
+    
+    dtype = resolve_dtype(data_type)
+    # Same truncated period as the output timestamps (UniformTimeAxis.from_frequency)
+    period_ns = int(1e9 / frequency)
+    tolerance_ns = period_ns // 2
+    
+    # Plan: samples to skip/read per file and the discontinuities between files
+    plan = []
+    discontinuities = []
+    previous = None
+    for info in infos:
+        start_ns = int(np.datetime64(info['start_datetime'], 'ns').astype(np.int64))
+        count = info['estimated_data_points']
+        skip = 0
+        if previous is not None:
+            prev_info, prev_end_ns = previous
+            delta_ns = start_ns - prev_end_ns
+            if abs(delta_ns) > tolerance_ns:
+                discontinuities.append({
+                    'type': 'gap' if delta_ns > 0 else 'overlap',
+                    'previous_file': prev_info['file_path'],
+                    'next_file': info['file_path'],
+                    'previous_end': pd.Timestamp(prev_end_ns),
+                    'next_start': pd.Timestamp(start_ns),
+                    'seconds': abs(delta_ns) / 1e9,
+                    'samples': round(abs(delta_ns) / period_ns),
+                })
+                if delta_ns < 0 and trim_overlaps:
+                    skip = min(count, -(delta_ns // period_ns))
+        end_ns = start_ns + count * period_ns
+        if previous is None or end_ns > previous[1]:
+            previous = (info, end_ns)
+        plan.append((info, start_ns, skip, count - skip))
+    
+    total_points = sum(n for _, _, _, n in plan)
+    values = np.empty(total_points, dtype=dtype)
+    timestamps = np.empty(total_points, dtype='datetime64[ns]')
+    
+    position = 0
+    for info, start_ns, skip, n in plan:
+        if n == 0:
+            continue
+        try:
+            with open(info['file_path'], 'rb') as f:
+                f.seek(skip * dtype.itemsize)
+                bytes_read = f.readinto(memoryview(values[position:position + n]).cast('B'))
+        except OSError as e:
+            raise PMUDataError(f"Failed to read signal data from {info['file_path']}: {e}")
+        if bytes_read != n * dtype.itemsize:
+            raise PMUDataError(f"Short read from {info['file_path']}: expected {n * dtype.itemsize} bytes, got {bytes_read}")
+        first_ns = start_ns + skip * period_ns
+        timestamps[position:position + n] = (first_ns + np.arange(n, dtype=np.int64) * period_ns).view('datetime64[ns]')
+        position += n
+    
+    for d in discontinuities:
+        logger.warning(f"{d['type'].capitalize()} of {d['seconds']:.6f}s ({d['samples']} samples) between "
+                       f"{os.path.basename(d['previous_file'])} and {os.path.basename(d['next_file'])}")
+    logger.info(f"Stitched {len(plan)} files into {total_points} data points")
+    
+    df = pd.DataFrame({'timestamp': timestamps, 'value': values}, copy=False)
+    return df, discontinuities
+
+
+def read_pmu_signal_batch(file_paths: Union[Sequence[str], Mapping[str, str]],
+                          max_workers: Optional[int] = None, wide: bool = False,
+                          mmap: bool = False,
+                          start: Optional[Union[datetime, pd.Timestamp]] = None,
+                          end: Optional[Union[datetime, pd.Timestamp]] = None
+                          ) -> Tuple[Union[Dict[str, pd.DataFrame], pd.DataFrame], Dict[str, str]]:
+    """
+    Read many PMU signal files concurrently on a thread pool.
+    
+    np.fromfile and memmap reads release the GIL, so the files are read in
+    parallel and wall-clock time is bound by the disks rather than the number
+    of files. Like read_pmu_signal_file_safe, a failing file does not abort the
+    batch: its error is logged and collected in the returned error report.
+    
+    Args:
+        file_paths (Sequence[str] or Mapping[str, str]): Paths to read, or a
+            {name: path} mapping to choose the result keys / column names
+        max_workers (int, optional): Thread count (default: min(32, number of files))
+        wide (bool): Return one DataFrame indexed by timestamp with a column per
+            file instead of a dict of per-file DataFrames (default: False)
+        mmap (bool): Memory-map the values instead of reading them into RAM
+        start (datetime, optional): First time to include (default: file start)
+        end (datetime, optional): Last time to include (default: file end)
+        
+    Returns:
+        Tuple: ({name: DataFrame} or wide DataFrame, {name: error message})
+    """
+    pd = _pandas()
+    if isinstance(file_paths, Mapping):
+        named_paths = dict(file_paths)
+    else:
+        named_paths = {path: path for path in file_paths}
+    if not named_paths:
+        return (pd.DataFrame() if wide else {}), {}
+    
+    def read_one(path):
+        return read_pmu_signal_file(path, mmap=mmap, start=start, end=end, raw=True)
+    
+    workers = max_workers or min(32, len(named_paths))
+    results = {}
+    errors = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {name: executor.submit(read_one, path) for name, path in named_paths.items()}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                logger.error(f"PMU processing error for {named_paths[name]}: {e}")
+                errors[name] = str(e)
+    
+    logger.info(f"Batch read {len(results)} of {len(named_paths)} files ({len(errors)} failed)")
+    
+    if not wide:
+        frames = {
+            name: pd.DataFrame({'timestamp': axis.to_datetimeindex(), 'value': values}, copy=not mmap)
+            for name, (values, axis) in results.items()
+        }
+        return frames, errors
+    
+    if not results:
+        return pd.DataFrame(), errors
+    axes = [axis for _, axis in results.values()]
+    if all(axis == axes[0] for axis in axes):
+        # Common case: channels of one export share a time axis, no alignment needed
+        wide_df = pd.DataFrame({name: values for name, (values, _) in results.items()},
+                               index=axes[0].to_datetimeindex(), copy=not mmap)
+    else:
+        wide_df = pd.concat(
+            [pd.Series(values, index=axis.to_datetimeindex(), name=name) for name, (values, axis) in results.items()],
+            axis=1
+        ).sort_index()
+    return wide_df, errors
+
+
+def read_pmu_signal_file_safe(file_path: str, mmap: bool = False) -> Optional[pd.DataFrame]:
     """
     Safe version of read_pmu_signal_file that returns None on error instead of raising exceptions.
     
     Args:
         file_path (str): Path to the .signal file
+        mmap (bool): Back the 'value' column with a zero-copy np.memmap
         
     Returns:
         Optional[pd.DataFrame]: DataFrame with signal data, or None if processing failed
     """
     try:
-        return read_pmu_signal_file(file_path)
+        return read_pmu_signal_file(file_path, mmap=mmap)
     except PMUDataError as e:
         logger.error(f"PMU processing error: {e}")
         return None
@@ -357,12 +1295,17 @@ def read_pmu_signal_file_safe(file_path: str) -> Optional[pd.DataFrame]:
         return None
 
 
-def get_pmu_file_info(file_path: str) -> dict:
+def get_pmu_file_info(file_path: str, stats: bool = False) -> dict:
     """
     Get metadata information about a PMU signal file without reading the full data.
     
+    With stats=True a 'stats' entry is added (see compute_signal_stats). The first
+    call makes one chunked pass over the file; later calls on an unchanged file
+    are served from the '.stats.json' sidecar.
+    
     Args:
         file_path (str): Path to the .signal file
+        stats (bool): Include summary statistics (min, max, mean, zero/NaN counts, percentiles)
         
     Returns:
         dict: Dictionary containing file metadata
@@ -379,16 +1322,13 @@ def get_pmu_file_info(file_path: str) -> dict:
     file_size = os.path.getsize(file_path)
     
     # Estimate number of data points based on file size and data type
-    dtype_sizes = {
-        'Float32': 4, 'Float64': 8, 'Int32': 4, 'Int16': 2, 'UInt32': 4, 'UInt16': 2
-    }
-    bytes_per_point = dtype_sizes.get(data_type, 4)  # Default to 4 bytes
+    bytes_per_point = np.dtype(DTYPE_MAPPING.get(data_type, np.float32)).itemsize  # Default to 4 bytes
     estimated_points = file_size // bytes_per_point
     
     # Calculate estimated duration
     estimated_duration_seconds = estimated_points / frequency if frequency > 0 else 0
     
-    return {
+    info = {
         'file_path': file_path,
         'filename': filename,
         'file_size_bytes': file_size,
@@ -401,6 +1341,198 @@ def get_pmu_file_info(file_path: str) -> dict:
         'estimated_duration_seconds': estimated_duration_seconds,
         'bytes_per_point': bytes_per_point
     }
+    
+    if stats:
+        info['stats'] = compute_signal_stats(file_path, data_type)
+    
+    return info
+
+
+class SignalCatalog:
+    """
+    Persistent index of the .signal files under a directory tree.
+    
+    Each file is described once with get_pmu_file_info (start, end, frequency,
+    data type, size) and the results are saved to CATALOG_FILENAME at the root.
+    On refresh only directories whose mtime changed are listed and parsed again;
+    unchanged directories are taken from the saved catalog. Note that appending
+    to an existing file does not change its directory's mtime, so sizes of
+    files still being written are only updated when the directory changes.
+    
+    A channel is a file's directory relative to the root ('.' for the root
+    itself). Per channel, files are kept sorted by start time so that range
+    queries are answered with binary search.
+    
+    Example:
+        catalog = SignalCatalog('data/pmu_export')
+        for path in catalog.files_between('VA_MAG', t0, t1):
+            df = read_pmu_signal_file(path, start=t0, end=t1)
+    """
+    
+    def __init__(self, root: str, catalog_path: Optional[str] = None, refresh: bool = True):
+        """
+        Args:
+            root (str): Root directory to catalog
+            catalog_path (str, optional): Where to persist the catalog (default: root/CATALOG_FILENAME)
+            refresh (bool): Scan for changes immediately (default: True)
+            
+        Raises:
+            PMUDataError: If root is not a directory
+        """
+        if not os.path.isdir(root):
+            raise PMUDataError(f"Catalog root is not a directory: {root}")
+        self.root = root
+        self.catalog_path = catalog_path or os.path.join(root, CATALOG_FILENAME)
+        self._directories = self._load()
+        self._index = {}
+        if refresh:
+            self.refresh()
+        else:
+            self._build_index()
+    
+    def _load(self) -> dict:
+        if not os.path.exists(self.catalog_path) or os.path.getsize(self.catalog_path) == 0:
+            return {}
+        try:
+            with open(self.catalog_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('directories', {})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable catalog {self.catalog_path}: {e}")
+            return {}
+    
+    def save(self) -> None:
+        """Write the catalog to catalog_path (in place, so the directory mtime is unchanged)."""
+        try:
+            with open(self.catalog_path, 'w', encoding='utf-8') as f:
+                json.dump({'root': os.path.abspath(self.root), 'directories': self._directories}, f)
+        except OSError as e:
+            logger.warning(f"Could not write catalog {self.catalog_path}: {e}")
+    
+    @staticmethod
+    def _describe(file_path: str) -> dict:
+        info = get_pmu_file_info(file_path)
+        start_ns = int(np.datetime64(info['start_datetime'], 'ns').astype(np.int64))
+        return {
+            'filename': info['filename'],
+            'start_ns': start_ns,
+            # Exclusive end: time just after the last sample
+            'end_ns': start_ns + info['estimated_data_points'] * 1_000_000_000 // info['frequency_hz'],
+            'frequency_hz': info['frequency_hz'],
+            'data_type': info['data_type'],
+            'file_size_bytes': info['file_size_bytes'],
+            'data_points': info['estimated_data_points'],
+        }
+    
+    def _scan_directory(self, rel_dir: str, mtime_ns: int) -> dict:
+        files, subdirs = [], []
+        with os.scandir(os.path.join(self.root, rel_dir)) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(os.path.normpath(os.path.join(rel_dir, entry.name)))
+                elif entry.name.endswith('.signal'):
+                    try:
+                        files.append(self._describe(entry.path))
+                    except PMUDataError as e:
+                        logger.warning(f"Skipping uncatalogable signal file: {e}")
+        files.sort(key=lambda f: f['start_ns'])
+        return {'mtime_ns': mtime_ns, 'files': files, 'subdirs': sorted(subdirs)}
+    
+    def refresh(self, save: bool = True) -> int:
+        """
+        Rescan directories whose mtime changed and rebuild the in-memory index.
+        
+        Args:
+            save (bool): Persist the catalog if anything changed (default: True)
+            
+        Returns:
+            int: Number of directories that were rescanned
+        """
+        if save and not os.path.exists(self.catalog_path):
+            # Create the catalog file before the scan: adding it changes the mtime of
+            # the directory that holds it, rewriting it in place later does not
+            try:
+                open(self.catalog_path, 'a').close()
+            except OSError as e:
+                logger.warning(f"Could not create catalog {self.catalog_path}: {e}")
+        previous = self._directories
+        current = {}
+        rescanned = 0
+        pending = ['.']
+        while pending:
+            rel_dir = pending.pop()
+            try:
+                mtime_ns = os.stat(os.path.join(self.root, rel_dir)).st_mtime_ns
+            except OSError:
+                continue
+            cached = previous.get(rel_dir)
+            if cached is None or cached['mtime_ns'] != mtime_ns:
+                cached = self._scan_directory(rel_dir, mtime_ns)
+                rescanned += 1
+            current[rel_dir] = cached
+            pending.extend(cached['subdirs'])
+        
+        changed = rescanned > 0 or set(current) != set(previous)
+        self._directories = current
+        self._build_index()
+        if changed and save:
+            self.save()
+        logger.info(f"Signal catalog refreshed: {rescanned} of {len(current)} directories rescanned")
+        return rescanned
+    
+    def _build_index(self) -> None:
+        self._index = {}
+        for rel_dir, entry in self._directories.items():
+            files = entry['files']
+            if not files:
+                continue
+            starts = [f['start_ns'] for f in files]
+            # Running maximum of end times keeps the end column sorted even if files overlap
+            max_ends = np.maximum.accumulate([f['end_ns'] for f in files]).tolist()
+            self._index[rel_dir] = (starts, max_ends, files)
+    
+    def channels(self) -> list:
+        """
+        Returns:
+            list: Channels (directories relative to root) that contain signal files
+        """
+        return sorted(self._index)
+    
+    def entries(self, channel: str) -> list:
+        """
+        Args:
+            channel (str): Channel directory relative to root
+            
+        Returns:
+            list: Catalog entries (dicts) for the channel, sorted by start time
+        """
+        return list(self._index.get(os.path.normpath(channel), ((), (), []))[2])
+    
+    def files_between(self, channel: str, t0=None, t1=None, entries: bool = False) -> list:
+        """
+        Files of a channel whose samples overlap [t0, t1], in start-time order.
+        
+        Args:
+            channel (str): Channel directory relative to root
+            t0 (datetime, optional): Range start (timezone-naive, default: unbounded)
+            t1 (datetime, optional): Range end, inclusive (default: unbounded)
+            entries (bool): Return catalog entry dicts instead of paths
+            
+        Returns:
+            list: File paths (or entries) covering the range
+        """
+        channel = os.path.normpath(channel)
+        if channel not in self._index:
+            return []
+        starts, max_ends, files = self._index[channel]
+        t0_ns = None if t0 is None else int(to_datetime64(t0).astype(np.int64))
+        t1_ns = None if t1 is None else int(to_datetime64(t1).astype(np.int64))
+        
+        lo = 0 if t0_ns is None else bisect.bisect_right(max_ends, t0_ns)
+        hi = len(files) if t1_ns is None else bisect.bisect_right(starts, t1_ns)
+        matches = [f for f in files[lo:hi] if t0_ns is None or f['end_ns'] > t0_ns]
+        if entries:
+            return matches
+        return [os.path.normpath(os.path.join(self.root, channel, f['filename'])) for f in matches]
 
 
 # Convenience function for backward compatibility